@@ -0,0 +1,11 @@
+
+    
+    
+
+
+
+select number_of_orders
+from "jaffle_shop"."main"."customers"
+where number_of_orders is null
+
+
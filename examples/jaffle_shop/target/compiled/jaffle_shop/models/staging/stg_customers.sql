@@ -0,0 +1,13 @@
+with source as (
+    select * from "jaffle_shop"."main"."raw_customers"
+),
+
+renamed as (
+    select
+        id as customer_id,
+        first_name,
+        last_name
+    from source
+)
+
+select * from renamed
\ No newline at end of file
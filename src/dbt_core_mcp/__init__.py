@@ -7,8 +7,10 @@ via the Model Context Protocol.
 
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as pkg_version
+from typing import TYPE_CHECKING, Any
 
-from .server import create_server
+if TYPE_CHECKING:
+    from .server import create_server
 
 try:
     __version__ = pkg_version("dbt-core-mcp")
@@ -16,3 +18,13 @@ except PackageNotFoundError:  # pragma: no cover - when not installed
     __version__ = "0.0.0"
 
 __all__ = ["create_server", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the server (and FastMCP with it) on first use, so `--version`/`--help` and
+    # imports of the dbt helper modules don't pay for it
+    if name == "create_server":
+        from .server import create_server
+
+        return create_server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
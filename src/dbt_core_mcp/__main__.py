@@ -10,8 +10,6 @@ import argparse
 import logging
 import sys
 
-from .server import create_server
-
 
 def setup_logging(debug: bool = False) -> None:
     """Set up logging configuration."""
@@ -88,6 +86,9 @@ def main() -> None:
 
     logging.info(f"Running version {__version__}")
 
+    # Imported after argument parsing so --help/--version return without loading FastMCP
+    from .server import create_server
+
     # Pass project_dir if specified, otherwise let server auto-detect from workspace roots
     # Treat timeout <= 0 as None (no timeout)
     timeout = args.dbt_command_timeout if args.dbt_command_timeout and args.dbt_command_timeout > 0 else None
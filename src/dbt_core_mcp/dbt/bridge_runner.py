@@ -1,14 +1,16 @@
 """
 Bridge Runner for dbt.
 
-Executes dbt commands in the user's Python environment via subprocess,
-using an inline Python script to invoke dbtRunner.
+Executes dbt commands in the user's Python environment via a long-lived
+worker subprocess that invokes dbtRunner for each command it receives.
 """
 
 import asyncio
 import json
 import logging
+import os
 import platform
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -16,10 +18,74 @@ import psutil
 
 from ..utils.env_detector import get_env_vars
 from ..utils.process_check import is_dbt_running, wait_for_dbt_completion
+from ..utils.project_config import load_project_config
+from .manifest import load_json_file
 from .runner import DbtRunnerResult
 
 logger = logging.getLogger(__name__)
 
+# Prefix of the line the worker prints after each command, carrying its JSON result
+_RESULT_MARKER = "__DBT_CORE_MCP_RESULT__"
+
+# Line the worker prints on stderr after each command, so the host knows that command's stderr is complete
+_STDERR_END_MARKER = "__DBT_CORE_MCP_STDERR_END__"
+
+# Only the tail of a command's stderr is kept for error reporting
+_STDERR_TAIL_LINES = 200
+
+# Max line length read from the worker's pipes (dbt show --output json can be one long line)
+_STREAM_LIMIT = 64 * 1024 * 1024
+
+# Worker loop run in the user's environment: reads one JSON array of dbt args per stdin line,
+# runs it with dbtRunner, closes the command's stderr with an end marker and prints the result
+# after the result marker. Importing dbt once here is what makes subsequent commands fast. The dbt_core_mcp mention in this script also keeps
+# is_dbt_running() from mistaking the worker for a user's own dbt process.
+_WORKER_SCRIPT = f"""
+# dbt_core_mcp bridge worker
+import json
+import os
+import sys
+
+# Disable interactive prompts
+os.environ['DBT_USE_COLORS'] = '0'
+os.environ['DBT_PRINTER_WIDTH'] = '80'
+
+from dbt.cli.main import dbtRunner
+
+
+def release_adapters():
+    # Close connections between commands so file-based databases (e.g. DuckDB)
+    # aren't held locked while the worker sits idle
+    try:
+        from dbt.adapters.factory import FACTORY, reset_adapters
+
+        for adapter in list(FACTORY.adapters.values()):
+            close_all = getattr(adapter.ConnectionManager, 'close_all_connections', None)
+            if callable(close_all):
+                close_all()
+        reset_adapters()
+    except Exception:
+        pass
+
+
+# One runner for the worker's lifetime; no manifest is passed in, so each command still
+# parses the project itself and picks up file changes
+runner = dbtRunner()
+
+for line in sys.stdin:
+    try:
+        result = runner.invoke(json.loads(line))
+        output = {{"success": result.success}}
+    except (Exception, SystemExit) as e:
+        output = {{"success": False, "error": str(e)}}
+    finally:
+        release_adapters()
+    sys.stderr.write("\\n{_STDERR_END_MARKER}\\n")
+    sys.stderr.flush()
+    sys.stdout.write("\\n{_RESULT_MARKER}" + json.dumps(output) + "\\n")
+    sys.stdout.flush()
+"""
+
 
 class BridgeRunner:
     """
@@ -44,45 +110,62 @@ class BridgeRunner:
         self.python_command = python_command
         self.timeout = timeout
         self._target_dir = self.project_dir / "target"
-        self._project_config: dict[str, Any] | None = None  # Lazy-loaded project configuration
-        self._project_config_mtime: float | None = None  # Track last modification time
 
-        # Detect profiles directory (project dir or ~/.dbt)
-        self.profiles_dir = self.project_dir if (self.project_dir / "profiles.yml").exists() else Path.home() / ".dbt"
+        # Long-lived worker process, started on first invoke and restarted if it dies.
+        # Its command line never changes, so it is assembled once here rather than per spawn.
+        self._worker_command = self._build_worker_command()
+        self._worker: asyncio.subprocess.Process | None = None
+        self._worker_loop: asyncio.AbstractEventLoop | None = None
+        self._worker_lock: asyncio.Lock | None = None  # serializes commands; bound to _worker_lock_loop
+        self._worker_lock_loop: asyncio.AbstractEventLoop | None = None
+        self._worker_stderr: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)  # stderr tail of the command in flight
+        self._worker_stderr_task: asyncio.Task[None] | None = None
+        self._worker_stderr_done: asyncio.Event | None = None  # set when the command's stderr end marker arrives
+
+        self.profiles_dir = self._detect_profiles_dir()
         logger.info(f"Using profiles directory: {self.profiles_dir}")
 
-    def _get_project_config(self) -> dict[str, Any]:
+    def _detect_profiles_dir(self) -> Path:
         """
-        Lazy-load and cache dbt_project.yml configuration.
-        Reloads if file has been modified since last read.
+        Resolve the profiles directory the way dbt itself does.
+
+        DBT_PROFILES_DIR wins, then a profiles.yml in the project directory, then ~/.dbt.
 
         Returns:
-            Dictionary with project configuration
+            Path to the directory containing profiles.yml
         """
-        import yaml
+        env_profiles_dir = os.environ.get("DBT_PROFILES_DIR")
+        if env_profiles_dir:
+            return Path(env_profiles_dir).expanduser().resolve()
 
-        project_file = self.project_dir / "dbt_project.yml"
+        try:
+            os.stat(self.project_dir / "profiles.yml")
+            return self.project_dir
+        except FileNotFoundError:
+            return Path.home() / ".dbt"
 
-        # Check if file exists and get modification time
-        if project_file.exists():
-            current_mtime = project_file.stat().st_mtime
+    def _build_worker_command(self) -> list[str]:
+        """
+        Build the command line that starts the worker in the user's environment.
 
-            # Reload if never loaded or file has changed
-            if self._project_config is None or self._project_config_mtime != current_mtime:
-                try:
-                    with open(project_file) as f:
-                        loaded_config = yaml.safe_load(f)
-                        self._project_config = loaded_config if isinstance(loaded_config, dict) else {}
-                    self._project_config_mtime = current_mtime
-                except Exception as e:
-                    logger.warning(f"Failed to parse dbt_project.yml: {e}")
-                    self._project_config = {}
-                    self._project_config_mtime = None
-        else:
-            self._project_config = {}
-            self._project_config_mtime = None
+        Returns:
+            Full argv for the worker subprocess
+        """
+        python_command = list(self.python_command)
+        if python_command[:2] == ["conda", "run"]:
+            # conda run buffers output until exit unless told otherwise, which would stall the worker
+            python_command.insert(2, "--no-capture-output")
+        return [*python_command, "-u", "-c", _WORKER_SCRIPT]
+
+    def _get_project_config(self) -> dict[str, Any]:
+        """
+        Load dbt_project.yml configuration.
+        Parsed once and reused until the file is modified.
 
-        return self._project_config if self._project_config is not None else {}
+        Returns:
+            Dictionary with project configuration
+        """
+        return load_project_config(self.project_dir)
 
     async def invoke(self, args: list[str]) -> DbtRunnerResult:
         """
@@ -95,113 +178,218 @@ class BridgeRunner:
             Result of the command execution
         """
         # Check if dbt is already running and wait for completion
-        if is_dbt_running(self.project_dir):
+        # (process scan and polling block, so keep them off the event loop)
+        if await asyncio.to_thread(is_dbt_running, self.project_dir):
             logger.info("dbt process detected, waiting for completion...")
-            if not wait_for_dbt_completion(self.project_dir, timeout=10.0, poll_interval=0.2):
+            if not await asyncio.to_thread(wait_for_dbt_completion, self.project_dir, timeout=10.0, poll_interval=0.2):
                 logger.error("Timeout waiting for dbt process to complete")
                 return DbtRunnerResult(
                     success=False,
                     exception=RuntimeError("dbt is already running in this project. Please wait for it to complete."),
                 )
 
-        # Build inline Python script to execute dbtRunner
-        script = self._build_script(args)
-
-        # Execute in user's environment
-        full_command = [*self.python_command, "-c", script]
+        # Add --profiles-dir to args if not already present
+        if "--profiles-dir" not in args:
+            args = [*args, "--profiles-dir", str(self.profiles_dir)]
 
         logger.info(f"Executing dbt command: {args}")
-        logger.info(f"Using Python: {self.python_command}")
-        logger.info(f"Working directory: {self.project_dir}")
+
+        # The worker runs one command at a time
+        async with self._get_worker_lock():
+            try:
+                worker = await self._ensure_worker()
+                return await asyncio.wait_for(self._run_in_worker(worker, args), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"dbt command timed out after {self.timeout} seconds, killing worker")
+                await self._stop_worker()
+                return DbtRunnerResult(
+                    success=False,
+                    exception=RuntimeError(f"dbt command timed out after {self.timeout} seconds"),
+                )
+            except asyncio.CancelledError:
+                # Kill the worker mid-command; a fresh one is started on the next invoke
+                logger.info("Cancellation detected, killing dbt worker")
+                await asyncio.shield(self._stop_worker())
+                raise
+            except Exception as e:
+                logger.exception(f"Error executing dbt command: {e}")
+                await self._stop_worker()
+                return DbtRunnerResult(success=False, exception=e, stdout="", stderr="")
+
+    def _get_worker_lock(self) -> asyncio.Lock:
+        """
+        Return the lock that serializes worker access, creating it for the running event loop.
+
+        Like the worker itself, the lock belongs to one event loop; a new one is made when
+        the runner is used from another loop.
+
+        Returns:
+            Lock for the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker_lock is None or self._worker_lock_loop is not loop:
+            self._worker_lock = asyncio.Lock()
+            self._worker_lock_loop = loop
+        return self._worker_lock
+
+    async def _ensure_worker(self) -> asyncio.subprocess.Process:
+        """
+        Return the running worker process, starting a new one if needed.
+
+        A worker is (re)started when none exists yet, when the previous one exited, or when
+        it was started on a different event loop than the current one.
+
+        Returns:
+            The worker subprocess
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and self._worker.returncode is None and self._worker_loop is loop:
+            return self._worker
+
+        await self._stop_worker()
 
         # Get environment-specific variables (e.g., PIPENV_IGNORE_VIRTUALENVS for pipenv)
         env_vars = get_env_vars(self.python_command)
         env = None
         if env_vars:
-            import os
-
             env = os.environ.copy()
             env.update(env_vars)
             logger.info(f"Adding environment variables: {list(env_vars.keys())}")
 
-        proc = None
-        try:
-            logger.info("Starting subprocess...")
-            # Use create_subprocess_exec for proper async process handling
-            proc = await asyncio.create_subprocess_exec(
-                *full_command,
-                cwd=self.project_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                stdin=asyncio.subprocess.DEVNULL,
-                env=env,
-            )
+        logger.info(f"Starting dbt worker using Python: {self.python_command}")
+        logger.info(f"Working directory: {self.project_dir}")
+        worker = await asyncio.create_subprocess_exec(
+            *self._worker_command,
+            cwd=self.project_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE,
+            env=env,
+            limit=_STREAM_LIMIT,
+        )
+        logger.info(f"dbt worker started (PID {worker.pid})")
+
+        self._worker = worker
+        self._worker_loop = loop
+        self._worker_stderr = deque(maxlen=_STDERR_TAIL_LINES)
+        self._worker_stderr_done = asyncio.Event()
+        self._worker_stderr_task = asyncio.create_task(self._drain_worker_stderr(worker))
+        return worker
+
+    async def _drain_worker_stderr(self, worker: asyncio.subprocess.Process) -> None:
+        """Continuously drain the worker's stderr so the pipe never fills up and blocks it.
+
+        Lines are streamed to the debug log as they arrive; only a bounded tail is kept in memory.
+        The worker's end-of-command marker line is not kept; it sets _worker_stderr_done instead.
+        """
+        assert worker.stderr is not None and self._worker_stderr_done is not None
+        while line_bytes := await worker.stderr.readline():
+            line = line_bytes.decode("utf-8", errors="replace")
+            if line.rstrip() == _STDERR_END_MARKER:
+                self._worker_stderr_done.set()
+                continue
+            self._worker_stderr.append(line)
+            # dbt can emit thousands of lines per command; skip formatting them when debug logging is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"dbt stderr: {line.rstrip()}")
+
+    async def _run_in_worker(self, worker: asyncio.subprocess.Process, args: list[str]) -> DbtRunnerResult:
+        """
+        Send one command to the worker and collect its output up to the result marker.
 
-            # Wait for completion with timeout
-            try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(),
-                    timeout=self.timeout,
-                )
-                stdout = stdout_bytes.decode("utf-8") if stdout_bytes else ""
-                stderr = stderr_bytes.decode("utf-8") if stderr_bytes else ""
-            except asyncio.TimeoutError:
-                # Kill process on timeout
-                logger.error(f"dbt command timed out after {self.timeout} seconds, killing process")
-                proc.kill()
-                await proc.wait()
-                return DbtRunnerResult(
-                    success=False,
-                    exception=RuntimeError(f"dbt command timed out after {self.timeout} seconds"),
-                )
+        Args:
+            worker: Running worker subprocess
+            args: dbt command arguments (including --profiles-dir)
 
-            returncode = proc.returncode
-            logger.info(f"Subprocess completed with return code: {returncode}")
+        Returns:
+            Result of the command execution
+        """
+        assert worker.stdin is not None and worker.stdout is not None and self._worker_stderr_done is not None
+        self._worker_stderr.clear()
+        self._worker_stderr_done.clear()
+
+        worker.stdin.write(json.dumps(args).encode("utf-8") + b"\n")
+        await worker.stdin.drain()
+
+        # Everything before the marker is this command's stdout; read it in bulk rather than line by line.
+        # The worker always writes a newline ahead of the marker, so log lines can't fake a result.
+        separator = b"\n" + _RESULT_MARKER.encode("utf-8")
+        chunks: list[bytes] = []
+        output: dict[str, Any] | None = None
+        while True:
+            try:
+                chunks.append(await worker.stdout.readuntil(separator))
+            except asyncio.LimitOverrunError as e:
+                # More output than the stream buffer holds; take what's safe and keep looking
+                chunks.append(await worker.stdout.readexactly(e.consumed))
+                continue
+            except asyncio.IncompleteReadError as e:
+                chunks.append(e.partial)
+                break
+            output = json.loads(await worker.stdout.readline())
+            chunks[-1] = chunks[-1][: -len(separator)]
+            break
+        stdout = b"".join(chunks).decode("utf-8", errors="replace")
+
+        if output is None:
+            # EOF before a result: the worker died (e.g. dbt isn't importable in this environment)
+            returncode = await worker.wait()
+            if self._worker_stderr_task is not None:
+                await self._worker_stderr_task
+            stderr = "".join(self._worker_stderr)
+            self._worker = None
+            error_msg = stderr.strip() or stdout.strip()
+            logger.error(f"dbt worker exited with code {returncode}")
+            logger.error(f"stdout: {stdout[:500]}")
+            logger.error(f"stderr: {stderr[:500]}")
+            return DbtRunnerResult(
+                success=False,
+                exception=RuntimeError(f"dbt command failed (exit code {returncode}): {error_msg[:500]}"),
+                stdout=stdout,
+                stderr=stderr,
+            )
 
-            # Parse result from stdout
-            if returncode == 0:
-                # Extract JSON from last line (DBT output may contain logs)
-                try:
-                    last_line = stdout.strip().split("\n")[-1]
-                    output = json.loads(last_line)
-                    success = output.get("success", False)
-                    logger.info(f"dbt command {'succeeded' if success else 'failed'}: {args}")
-                    return DbtRunnerResult(success=success, stdout=stdout, stderr=stderr)
-                except (json.JSONDecodeError, IndexError) as e:
-                    # If no JSON output, check return code
-                    logger.warning(f"No JSON output from dbt command: {e}. stdout: {stdout[:200]}")
-                    return DbtRunnerResult(success=True, stdout=stdout, stderr=stderr)
-            else:
-                # Non-zero return code indicates failure
-                error_msg = stderr.strip() if stderr else stdout.strip()
-                logger.error(f"dbt command failed with code {returncode}")
-                logger.error(f"stdout: {stdout[:500]}")
-                logger.error(f"stderr: {stderr[:500]}")
-
-                # Try to extract meaningful error from stderr or stdout
-                if not error_msg and stdout:
-                    error_msg = stdout.strip()
+        # The worker ends stderr before printing the result; wait until the drain has read that far
+        await self._worker_stderr_done.wait()
+        stderr = "".join(self._worker_stderr)
+
+        success = bool(output.get("success", False))
+        logger.info(f"dbt command {'succeeded' if success else 'failed'}: {args}")
+        if success:
+            return DbtRunnerResult(success=True, stdout=stdout, stderr=stderr)
+
+        error_msg = stderr.strip() or str(output.get("error") or "") or stdout.strip()
+        logger.error(f"stdout: {stdout[:500]}")
+        logger.error(f"stderr: {stderr[:500]}")
+        return DbtRunnerResult(
+            success=False,
+            exception=RuntimeError(f"dbt command failed: {error_msg[:500]}"),
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    async def _stop_worker(self) -> None:
+        """Kill the worker process, if any. The next invoke starts a fresh one."""
+        worker, self._worker = self._worker, None
+        if self._worker_stderr_task is not None:
+            self._worker_stderr_task.cancel()
+            self._worker_stderr_task = None
+        if worker is None or worker.returncode is not None:
+            return
 
-                return DbtRunnerResult(
-                    success=False,
-                    exception=RuntimeError(f"dbt command failed (exit code {returncode}): {error_msg[:500]}"),
-                    stdout=stdout,
-                    stderr=stderr,
-                )
+        if self._worker_loop is asyncio.get_running_loop():
+            await self._kill_process_tree(worker)
+        else:
+            # Started on an event loop that is gone; its transport can't be used anymore
+            try:
+                psutil.Process(worker.pid).kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
 
-        except asyncio.CancelledError:
-            # Kill the subprocess when cancelled
-            if proc and proc.returncode is None:
-                logger.info(f"Cancellation detected, killing subprocess PID {proc.pid}")
-                await asyncio.shield(self._kill_process_tree(proc))
-            raise
-        except Exception as e:
-            logger.exception(f"Error executing dbt command: {e}")
-            # Clean up process on unexpected errors
-            if proc and proc.returncode is None:
-                proc.kill()
-                await proc.wait()
-            return DbtRunnerResult(success=False, exception=e, stdout="", stderr="")
+    async def close(self) -> None:
+        """Shut down the worker process."""
+        async with self._get_worker_lock():
+            await self._stop_worker()
 
     async def _kill_process_tree(self, proc: asyncio.subprocess.Process) -> None:
         """Kill a process and all its children."""
@@ -352,8 +540,7 @@ class BridgeRunner:
             manifest_path = self.get_manifest_path()
             if manifest_path.exists():
                 try:
-                    with open(manifest_path) as f:
-                        manifest = json.load(f)
+                    manifest = load_json_file(manifest_path)
 
                     # Check if model has compiled_code
                     nodes = manifest.get("nodes", {})
@@ -372,49 +559,3 @@ class BridgeRunner:
         result = await self.invoke(args)
 
         return result
-
-    def _build_script(self, args: list[str]) -> str:
-        """
-        Build inline Python script to execute dbtRunner.
-
-        Args:
-            args: dbt command arguments
-
-        Returns:
-            Python script as string
-        """
-        # Add --profiles-dir to args if not already present
-        if "--profiles-dir" not in args:
-            args = [*args, "--profiles-dir", str(self.profiles_dir)]
-
-        # Convert args to JSON-safe format
-        args_json = json.dumps(args)
-
-        script = f"""
-import sys
-import json
-import os
-
-# Disable interactive prompts
-os.environ['DBT_USE_COLORS'] = '0'
-os.environ['DBT_PRINTER_WIDTH'] = '80'
-
-try:
-    from dbt.cli.main import dbtRunner
-    
-    # Execute dbtRunner with arguments
-    dbt = dbtRunner()
-    result = dbt.invoke({args_json})
-    
-    # Return success status
-    output = {{"success": result.success}}
-    print(json.dumps(output))
-    sys.exit(0 if result.success else 1)
-    
-except Exception as e:
-    # Ensure we always exit, even on error
-    error_output = {{"success": False, "error": str(e)}}
-    print(json.dumps(error_output))
-    sys.exit(1)
-"""
-        return script
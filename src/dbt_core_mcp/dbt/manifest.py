@@ -6,46 +6,98 @@ to models, sources, tests, and other DBT entities.
 """
 
 import asyncio
-import json
 import logging
-from dataclasses import dataclass
+import mmap
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Batched field extraction for get_resources: one C-level call per node instead of a .get() per field.
+# Falls back to per-field .get() with defaults for the rare entry missing one of the keys.
+_COMMON_FIELDS: tuple[tuple[str, Any], ...] = (("name", ""), ("package_name", ""), ("description", ""), ("tags", []))
+_RELATION_FIELDS: tuple[tuple[str, Any], ...] = (("schema", ""), ("database", ""), ("alias", ""))
+_SOURCE_FIELDS: tuple[tuple[str, Any], ...] = (
+    ("name", ""),
+    ("source_name", ""),
+    ("schema", ""),
+    ("database", ""),
+    ("identifier", ""),
+    ("package_name", ""),
+    ("description", ""),
+    ("tags", []),
+)
+_get_common_fields = itemgetter(*(key for key, _ in _COMMON_FIELDS))
+_get_relation_fields = itemgetter(*(key for key, _ in _RELATION_FIELDS))
+_get_source_fields = itemgetter(*(key for key, _ in _SOURCE_FIELDS))
+
+# Node types that are materialized as relations and come from a file in the project
+_MATERIALIZED_TYPES = frozenset({"model", "seed", "snapshot"})
+
+# Accepted resource_type filters for resource listing and lookup
+_VALID_RESOURCE_TYPES = frozenset({"model", "source", "seed", "snapshot", "test", "analysis"})
+
+
+def _extract(getter: Callable[[dict[str, Any]], Any], fields: tuple[tuple[str, Any], ...], node: dict[str, Any]) -> tuple[Any, ...]:
+    """Fetch several fields from a manifest entry at once, using defaults for any that are missing."""
+    try:
+        return getter(node)
+    except KeyError:
+        return tuple(node.get(key, default) for key, default in fields)
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON artifact (run_results.json, a saved state manifest, ...) with orjson.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON content
+    """
+    return orjson.loads(path.read_bytes())
+
+
+# Newest parsed manifest per resolved path, as (mtime_ns, size, manifest). Shared by every
+# ManifestLoader in the process and replaced on reload, so older versions are never retained.
+_MANIFEST_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
 
-@dataclass
-class DbtModel:
-    """Represents a dbt model from the manifest."""
 
-    name: str
-    unique_id: str
-    resource_type: str
-    schema: str
-    database: str
-    alias: str
-    description: str
-    materialization: str
-    tags: list[str]
-    depends_on: list[str]
-    package_name: str
-    original_file_path: str
+def _read_manifest_file(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a manifest file, reusing the cached parse while the file is unchanged.
 
+    Only the newest version of each file is kept, and the parsed dictionary is shared by
+    every ManifestLoader in the process, so it is treated as read-only.
+
+    The file is memory-mapped and orjson parses it without first copying it into a bytes
+    object.
+
+    Args:
+        path: Resolved path to manifest.json
+        mtime_ns: File modification time, identifies the file version
+        size: File size in bytes (empty files can't be memory-mapped)
+
+    Returns:
+        Parsed manifest dictionary
+    """
+    cached = _MANIFEST_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+        return cached[2]
 
-@dataclass
-class DbtSource:
-    """Represents a dbt source from the manifest."""
+    if size == 0:
+        manifest = orjson.loads(path.read_bytes())
+    else:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            manifest = orjson.loads(view)
 
-    name: str
-    unique_id: str
-    source_name: str
-    schema: str
-    database: str
-    identifier: str
-    description: str
-    tags: list[str]
-    package_name: str
+    _MANIFEST_CACHE[path] = (mtime_ns, size, manifest)
+    return manifest
 
 
 class ManifestLoader:
@@ -64,21 +116,91 @@ class ManifestLoader:
         """
         self.manifest_path = manifest_path
         self._manifest: dict[str, Any] | None = None
+        self._manifest_stat: tuple[int, int] | None = None  # (st_mtime_ns, st_size) of the loaded file
+
+        # Lookup indexes derived from the manifest, built lazily on first lookup after each (re)load
+        self._indexes_built = False
+        self._node_uids_by_name: dict[str, list[str]] = {}  # names can repeat across resource types
+        self._node_uids_by_type: dict[str, list[str]] = {}
+        self._node_uids_by_name_and_type: dict[tuple[str, str], list[str]] = {}
+        self._source_uids_by_name: dict[str, list[str]] = {}
+        self._source_uid_by_pair: dict[tuple[str, str], str] = {}
+
+        # Memoized lineage traversals keyed by (edge map, unique_id, max_depth), reset on reload
+        self._traversal_cache: dict[tuple[str, str, int | None], tuple[dict[str, Any], ...]] = {}
+
+        # get_resources() results keyed by resource_type filter, reset on reload; tuples so the
+        # cached sequence itself can't be changed through a returned reference
+        self._resources_cache: dict[str | None, tuple[dict[str, Any], ...]] = {}
+        self._project_info: Mapping[str, Any] | None = None
 
     async def load(self) -> None:
-        """Load the manifest from disk."""
-        if not self.manifest_path.exists():
-            raise FileNotFoundError(f"Manifest not found: {self.manifest_path}")
+        """Load the manifest from disk.
+
+        Skips re-reading when the file's mtime and size are unchanged since the last load,
+        so repeated calls are cheap. Parsed manifests are also shared across loaders in the
+        process, so a new loader for an unchanged file doesn't parse it again.
+        """
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Manifest not found: {self.manifest_path}") from None
+
+        manifest_stat = (stat.st_mtime_ns, stat.st_size)
+        if self._manifest is not None and manifest_stat == self._manifest_stat:
+            logger.debug("Manifest unchanged since last load, reusing parsed data")
+            return
 
         logger.debug(f"Loading manifest from {self.manifest_path}")
 
-        def _read_manifest() -> dict[str, Any]:
-            with open(self.manifest_path, "r") as f:
-                return json.load(f)
+        manifest = await asyncio.to_thread(_read_manifest_file, self.manifest_path.resolve(), *manifest_stat)
 
-        self._manifest = await asyncio.to_thread(_read_manifest)
+        self._manifest = manifest
+        self._manifest_stat = manifest_stat
+        self._indexes_built = False
+        self._traversal_cache.clear()
+        self._resources_cache.clear()
+        self._project_info = None
         logger.info("Manifest loaded successfully")
 
+    def _ensure_indexes(self) -> None:
+        """Build lookup indexes over the loaded manifest on first use.
+
+        Deferred until a lookup needs them, so callers that only reload the manifest
+        (or only read the raw dict) never pay for indexing.
+        """
+        if self._indexes_built:
+            return
+        assert self._manifest is not None
+
+        node_uids_by_name: dict[str, list[str]] = {}
+        node_uids_by_type: dict[str, list[str]] = {}
+        node_uids_by_name_and_type: dict[tuple[str, str], list[str]] = {}
+        for unique_id, node in self._manifest.get("nodes", {}).items():
+            if isinstance(node, dict):
+                name = node.get("name", "")
+                node_type = node.get("resource_type", "")
+                node_uids_by_name.setdefault(name, []).append(unique_id)
+                node_uids_by_type.setdefault(node_type, []).append(unique_id)
+                node_uids_by_name_and_type.setdefault((name, node_type), []).append(unique_id)
+
+        source_uids_by_name: dict[str, list[str]] = {}
+        source_uid_by_pair: dict[tuple[str, str], str] = {}
+
+        for unique_id, source in self._manifest.get("sources", {}).items():
+            if not isinstance(source, dict):
+                continue
+            name = source.get("name", "")
+            source_uids_by_name.setdefault(name, []).append(unique_id)
+            source_uid_by_pair.setdefault((source.get("source_name", ""), name), unique_id)
+
+        self._node_uids_by_name = node_uids_by_name
+        self._source_uids_by_name = source_uids_by_name
+        self._source_uid_by_pair = source_uid_by_pair
+        self._node_uids_by_type = node_uids_by_type
+        self._node_uids_by_name_and_type = node_uids_by_name_and_type
+        self._indexes_built = True
+
     def is_loaded(self) -> bool:
         """Check if the manifest data has been loaded.
 
@@ -87,7 +209,7 @@ class ManifestLoader:
         """
         return self._manifest is not None
 
-    def get_resources(self, resource_type: str | None = None) -> list[dict[str, Any]]:
+    def get_resources(self, resource_type: str | None = None, offset: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
         """
         Get all resources from the manifest, optionally filtered by type.
 
@@ -97,9 +219,12 @@ class ManifestLoader:
         Args:
             resource_type: Optional filter (model, source, seed, snapshot, test, analysis).
                           If None, returns all resources.
+            offset: Number of resources to skip (for paging)
+            limit: Maximum number of resources to return (None = all remaining)
 
         Returns:
-            List of resource dictionaries with consistent structure:
+            New list of resource dictionaries (the dicts are shared between calls and must
+            not be modified) with consistent structure:
             {
                 "name": str,
                 "unique_id": str,
@@ -116,57 +241,102 @@ class ManifestLoader:
             RuntimeError: If manifest not loaded
             ValueError: If invalid resource_type provided
         """
+        resources = self._get_cached_resources(resource_type)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(resources)} resources" + (f" of type '{resource_type}'" if resource_type else ""))
+        # Fresh list per call so callers can reorder/trim it without touching the cache; only the
+        # requested page is copied
+        if offset or limit is not None:
+            return list(resources[offset : None if limit is None else offset + limit])
+        return list(resources)
+
+    def _get_cached_resources(self, resource_type: str | None) -> tuple[dict[str, Any], ...]:
+        """Validate the filter and return the memoized resources behind get_resources()."""
         if not self._manifest:
             raise RuntimeError("Manifest not loaded. Call load() first.")
 
         # Validate resource_type if provided
-        valid_types = {"model", "source", "seed", "snapshot", "test", "analysis"}
-        if resource_type is not None and resource_type not in valid_types:
-            raise ValueError(f"Invalid resource_type '{resource_type}'. Must be one of: {', '.join(sorted(valid_types))}")
+        if resource_type is not None and resource_type not in _VALID_RESOURCE_TYPES:
+            raise ValueError(f"Invalid resource_type '{resource_type}'. Must be one of: {', '.join(sorted(_VALID_RESOURCE_TYPES))}")
+
+        resources = self._resources_cache.get(resource_type)
+        if resources is None:
+            resources = tuple(self.iter_resources(resource_type))
+            self._resources_cache[resource_type] = resources
+        return resources
+
+    def iter_resources(self, resource_type: str | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Lazily yield resources from the manifest, optionally filtered by type.
 
-        resources: list[dict[str, Any]] = []
+        Same items as get_resources(), but built one at a time so callers that only need the
+        first few matches or a count don't pay for the whole list.
+
+        Args:
+            resource_type: Optional filter (model, source, seed, snapshot, test, analysis).
+                          If None, yields all resources.
+
+        Returns:
+            Iterator over resource dictionaries (see get_resources() for their structure)
+
+        Raises:
+            RuntimeError: If manifest not loaded
+            ValueError: If invalid resource_type provided
+        """
+        if not self._manifest:
+            raise RuntimeError("Manifest not loaded. Call load() first.")
+
+        # Validate resource_type if provided (eagerly, not on first next())
+        if resource_type is not None and resource_type not in _VALID_RESOURCE_TYPES:
+            raise ValueError(f"Invalid resource_type '{resource_type}'. Must be one of: {', '.join(sorted(_VALID_RESOURCE_TYPES))}")
+
+        return self._iter_resources(resource_type)
+
+    def _iter_resources(self, resource_type: str | None) -> Iterator[dict[str, Any]]:
+        """Generator behind iter_resources(); expects a loaded manifest and a validated type."""
+        assert self._manifest is not None
 
         # Collect from nodes (models, tests, seeds, snapshots, analyses)
         nodes = self._manifest.get("nodes", {})
-        for unique_id, node in nodes.items():
+        if resource_type is None:
+            node_items = nodes.items()
+        else:
+            # Only visit nodes of the requested type via the type index
+            self._ensure_indexes()
+            node_items = ((unique_id, nodes[unique_id]) for unique_id in self._node_uids_by_type.get(resource_type, []))
+
+        for unique_id, node in node_items:
             if not isinstance(node, dict):
                 continue
 
             node_type = node.get("resource_type")
-
-            # Filter by type if specified
-            if resource_type is not None and node_type != resource_type:
-                continue
+            name, package_name, description, tags = _extract(_get_common_fields, _COMMON_FIELDS, node)
 
             # Build consistent resource dict
             resource: dict[str, Any] = {
-                "name": node.get("name", ""),
+                "name": name,
                 "unique_id": unique_id,
                 "resource_type": node_type,
-                "package_name": node.get("package_name", ""),
-                "description": node.get("description", ""),
-                "tags": node.get("tags", []),
+                "package_name": package_name,
+                "description": description,
+                "tags": tags,
             }
 
-            # Add common fields for materialized resources
-            if node_type in ("model", "seed", "snapshot"):
-                resource["schema"] = node.get("schema", "")
-                resource["database"] = node.get("database", "")
-                resource["alias"] = node.get("alias", "")
-
-            # Add type-specific fields
-            if node_type == "model":
-                resource["materialization"] = node.get("config", {}).get("materialized", "")
-                resource["file_path"] = node.get("original_file_path", "")
-            elif node_type == "seed":
-                resource["file_path"] = node.get("original_file_path", "")
-            elif node_type == "snapshot":
+            # Add common and type-specific fields for materialized resources
+            if node_type in _MATERIALIZED_TYPES:
+                resource["schema"], resource["database"], resource["alias"] = _extract(_get_relation_fields, _RELATION_FIELDS, node)
+                if node_type == "model":
+                    try:
+                        resource["materialization"] = node["config"]["materialized"]
+                    except (KeyError, TypeError):
+                        resource["materialization"] = ""
                 resource["file_path"] = node.get("original_file_path", "")
             elif node_type == "test":
                 resource["test_metadata"] = node.get("test_metadata", {})
                 resource["column_name"] = node.get("column_name")
 
-            resources.append(resource)
+            yield resource
 
         # Collect from sources (if not filtered out)
         if resource_type is None or resource_type == "source":
@@ -175,23 +345,21 @@ class ManifestLoader:
                 if not isinstance(source, dict):
                     continue
 
+                name, source_name, schema, database, identifier, package_name, description, tags = _extract(_get_source_fields, _SOURCE_FIELDS, source)
                 resource = {
-                    "name": source.get("name", ""),
+                    "name": name,
                     "unique_id": unique_id,
                     "resource_type": "source",
-                    "source_name": source.get("source_name", ""),
-                    "schema": source.get("schema", ""),
-                    "database": source.get("database", ""),
-                    "identifier": source.get("identifier", ""),
-                    "package_name": source.get("package_name", ""),
-                    "description": source.get("description", ""),
-                    "tags": source.get("tags", []),
+                    "source_name": source_name,
+                    "schema": schema,
+                    "database": database,
+                    "identifier": identifier,
+                    "package_name": package_name,
+                    "description": description,
+                    "tags": tags,
                 }
 
-                resources.append(resource)
-
-        logger.debug(f"Found {len(resources)} resources" + (f" of type '{resource_type}'" if resource_type else ""))
-        return resources
+                yield resource
 
     def get_compiled_code(self, name: str) -> str | None:
         """
@@ -224,7 +392,8 @@ class ManifestLoader:
 
         Returns:
             Single resource dict if exactly one match found, or dict with multiple_matches=True
-            containing all matching resources for LLM to process.
+            containing all matching resources for LLM to process. Resource dicts are the
+            manifest's own entries (not copies) and must be treated as read-only.
 
         Raises:
             RuntimeError: If manifest not loaded
@@ -239,50 +408,10 @@ class ManifestLoader:
             raise RuntimeError("Manifest not loaded. Call load() first.")
 
         # Validate resource_type if provided
-        valid_types = {"model", "source", "seed", "snapshot", "test", "analysis"}
-        if resource_type is not None and resource_type not in valid_types:
-            raise ValueError(f"Invalid resource_type '{resource_type}'. Must be one of: {', '.join(sorted(valid_types))}")
-
-        matches: list[dict[str, Any]] = []
-
-        # For sources, try "source_name.table_name" format first
-        if "." in name and (resource_type is None or resource_type == "source"):
-            parts = name.split(".", 1)
-            if len(parts) == 2:
-                # Search sources dict directly
-                sources_dict = self._manifest.get("sources", {})
-                for _, source in sources_dict.items():
-                    if isinstance(source, dict) and source.get("source_name") == parts[0] and source.get("name") == parts[1]:
-                        matches.append(dict(source))
-                        break
-
-        # Search nodes (models, tests, snapshots, seeds, analyses, etc.)
-        nodes = self._manifest.get("nodes", {})
-        for unique_id, node in nodes.items():
-            if not isinstance(node, dict):
-                continue
-
-            node_type = node.get("resource_type")
-            node_name = node.get("name")
-
-            # Type filter if specified
-            if resource_type is not None and node_type != resource_type:
-                continue
+        if resource_type is not None and resource_type not in _VALID_RESOURCE_TYPES:
+            raise ValueError(f"Invalid resource_type '{resource_type}'. Must be one of: {', '.join(sorted(_VALID_RESOURCE_TYPES))}")
 
-            if node_name == name:
-                matches.append(dict(node))
-
-        # Search sources by table name only (fallback when no dot in name)
-        if resource_type is None or resource_type == "source":
-            sources = self._manifest.get("sources", {})
-            for unique_id, source in sources.items():
-                if not isinstance(source, dict):
-                    continue
-
-                if source.get("name") == name:
-                    # Avoid duplicates if already matched via source_name.table_name
-                    if not any(m.get("unique_id") == unique_id for m in matches):
-                        matches.append(dict(source))
+        matches = self._find_resource_nodes(name, resource_type)
 
         # Handle results based on match count
         if len(matches) == 0:
@@ -301,6 +430,48 @@ class ManifestLoader:
                 "message": f"Found {len(matches)} resources named '{name}'. Returning all matches for context.",
             }
 
+    def _find_resource_nodes(self, name: str, resource_type: str | None) -> list[dict[str, Any]]:
+        """Collect every manifest entry matching a resource name, without raising on a miss.
+
+        Args:
+            name: Resource name, or "source_name.table_name" for sources
+            resource_type: Optional, already validated resource type filter
+
+        Returns:
+            Matching manifest entries (not copies), empty if nothing matches
+        """
+        assert self._manifest is not None
+        self._ensure_indexes()
+
+        # Keyed by unique_id, so a resource reachable through several lookups is listed once
+        matches_by_uid: dict[str, dict[str, Any]] = {}
+
+        sources = self._manifest.get("sources", {})
+
+        # For sources, try "source_name.table_name" format first
+        if "." in name and (resource_type is None or resource_type == "source"):
+            source_name, table_name = name.split(".", 1)
+            source_uid = self._source_uid_by_pair.get((source_name, table_name))
+            if source_uid is not None:
+                matches_by_uid[source_uid] = sources[source_uid]
+
+        # Search nodes (models, tests, snapshots, seeds, analyses, etc.)
+        if resource_type != "source":
+            nodes = self._manifest.get("nodes", {})
+            if resource_type is None:
+                node_uids = self._node_uids_by_name.get(name, [])
+            else:
+                node_uids = self._node_uids_by_name_and_type.get((name, resource_type), [])
+            for unique_id in node_uids:
+                matches_by_uid.setdefault(unique_id, nodes[unique_id])
+
+        # Search sources by table name only (fallback when no dot in name)
+        if resource_type is None or resource_type == "source":
+            for unique_id in self._source_uids_by_name.get(name, []):
+                matches_by_uid.setdefault(unique_id, sources[unique_id])
+
+        return list(matches_by_uid.values())
+
     def get_resource_info(
         self,
         name: str,
@@ -355,31 +526,37 @@ class ManifestLoader:
 
         return result_copy
 
-    def get_project_info(self) -> dict[str, Any]:
+    def get_project_info(self) -> Mapping[str, Any]:
         """
         Get high-level project information from the manifest.
 
+        Built once per loaded manifest and shared between callers, hence read-only;
+        merge it into a new dict to add fields.
+
         Returns:
-            Dictionary with project metadata
+            Read-only mapping with project metadata
         """
         if not self._manifest:
             raise RuntimeError("Manifest not loaded. Call load() first.")
 
-        metadata: dict[str, Any] = self._manifest.get("metadata", {})  # type: ignore[assignment]
-
-        # Count resources directly from manifest
-        nodes = self._manifest.get("nodes", {})
-        model_count = sum(1 for node in nodes.values() if isinstance(node, dict) and node.get("resource_type") == "model")
-        source_count = len(self._manifest.get("sources", {}))
-
-        return {
-            "project_name": metadata.get("project_name", ""),
-            "dbt_version": metadata.get("dbt_version", ""),
-            "adapter_type": metadata.get("adapter_type", ""),
-            "generated_at": metadata.get("generated_at", ""),
-            "model_count": model_count,
-            "source_count": source_count,
-        }
+        if self._project_info is None:
+            metadata: dict[str, Any] = self._manifest.get("metadata", {})  # type: ignore[assignment]
+
+            # Model count comes from the type index, instead of rescanning nodes
+            self._ensure_indexes()
+            source_count = len(self._manifest.get("sources", {}))
+
+            self._project_info = MappingProxyType(
+                {
+                    "project_name": metadata.get("project_name", ""),
+                    "dbt_version": metadata.get("dbt_version", ""),
+                    "adapter_type": metadata.get("adapter_type", ""),
+                    "generated_at": metadata.get("generated_at", ""),
+                    "model_count": len(self._node_uids_by_type.get("model", [])),
+                    "source_count": source_count,
+                }
+            )
+        return self._project_info
 
     def get_manifest_dict(self) -> dict[str, Any]:
         """Get the raw manifest dictionary.
@@ -394,14 +571,14 @@ class ManifestLoader:
             raise RuntimeError("Manifest not loaded. Call load() first.")
         return self._manifest
 
-    def get_node_by_unique_id(self, unique_id: str) -> dict[str, Any] | None:
+    def get_node_by_unique_id(self, unique_id: str) -> Mapping[str, Any] | None:
         """Get a node (model, test, etc.) by its unique_id.
 
         Args:
             unique_id: The unique identifier (e.g., 'model.package.model_name')
 
         Returns:
-            Node dictionary or None if not found
+            Read-only view of the node, or None if not found. Copy with dict() before mutating.
         """
         if not self._manifest:
             raise RuntimeError("Manifest not loaded. Call load() first.")
@@ -409,65 +586,83 @@ class ManifestLoader:
         # Check nodes first (models, tests, snapshots, etc.)
         nodes = self._manifest.get("nodes", {})
         if unique_id in nodes:
-            return dict(nodes[unique_id])
+            return MappingProxyType(nodes[unique_id])
 
         # Check sources
         sources = self._manifest.get("sources", {})
         if unique_id in sources:
-            return dict(sources[unique_id])
+            return MappingProxyType(sources[unique_id])
 
         return None
 
-    def get_upstream_nodes(self, unique_id: str, max_depth: int | None = None, current_depth: int = 0) -> list[dict[str, Any]]:
-        """Get all upstream dependencies of a node recursively.
+    def get_upstream_nodes(self, unique_id: str, max_depth: int | None = None) -> list[dict[str, Any]]:
+        """Get all upstream dependencies of a node.
 
         Args:
             unique_id: The unique identifier of the node
             max_depth: Maximum depth to traverse (None for unlimited)
-            current_depth: Current recursion depth (internal use)
 
         Returns:
             List of dictionaries with upstream node info:
             {"unique_id": str, "name": str, "type": str, "distance": int}
         """
+        return self._traverse("parent_map", unique_id, max_depth)
+
+    def _traverse(self, edge_map: str, unique_id: str, max_depth: int | None) -> list[dict[str, Any]]:
+        """Breadth-first walk over parent_map or child_map starting from a node.
+
+        Each node is expanded at most once, so shared ancestors/descendants in diamond-shaped
+        DAGs cost O(V+E) rather than being re-walked per branch. Distance is the shortest hop
+        count from the starting node. Results are memoized until the manifest is reloaded.
+
+        Args:
+            edge_map: Manifest key holding the adjacency lists ("parent_map" or "child_map")
+            unique_id: The unique identifier of the starting node
+            max_depth: Maximum depth to traverse (None for unlimited)
+
+        Returns:
+            List of node info dictionaries in BFS order
+        """
         if not self._manifest:
             raise RuntimeError("Manifest not loaded. Call load() first.")
 
-        if max_depth is not None and current_depth >= max_depth:
-            return []
-
-        parent_map = self._manifest.get("parent_map", {})
-        parents = parent_map.get(unique_id, [])
+        cache_key = (edge_map, unique_id, max_depth)
+        cached = self._traversal_cache.get(cache_key)
+        if cached is None:
+            edges: dict[str, list[str]] = self._manifest.get(edge_map, {})
+            found: list[dict[str, Any]] = []
+            seen: set[str] = {unique_id}
+            queue: deque[tuple[str, int]] = deque()
 
-        upstream: list[dict[str, Any]] = []
-        seen: set[str] = set()
+            if max_depth is None or max_depth > 0:
+                queue.extend((uid, 1) for uid in edges.get(unique_id, []))
 
-        for parent_id in parents:
-            if parent_id in seen:
-                continue
-            seen.add(parent_id)
+            while queue:
+                uid, distance = queue.popleft()
+                if uid in seen:
+                    continue
+                seen.add(uid)
 
-            node = self.get_node_by_unique_id(parent_id)
-            if node:
-                resource_type = node.get("resource_type", "unknown")
-                upstream.append(
+                node = self.get_node_by_unique_id(uid)
+                if not node:
+                    continue
+                found.append(
                     {
-                        "unique_id": parent_id,
+                        "unique_id": uid,
                         "name": node.get("name", ""),
-                        "type": resource_type,
-                        "distance": current_depth + 1,
+                        "type": node.get("resource_type", "unknown"),
+                        "distance": distance,
                     }
                 )
 
-                # Recurse
-                if max_depth is None or current_depth + 1 < max_depth:
-                    grandparents = self.get_upstream_nodes(parent_id, max_depth, current_depth + 1)
-                    for gp in grandparents:
-                        if gp["unique_id"] not in seen:
-                            seen.add(str(gp["unique_id"]))
-                            upstream.append(gp)
+                if max_depth is None or distance < max_depth:
+                    queue.extend((next_uid, distance + 1) for next_uid in edges.get(uid, []) if next_uid not in seen)
+
+            cached = tuple(found)
+            self._traversal_cache[cache_key] = cached
 
-        return upstream
+        # Hand out copies so callers can't mutate the memoized entries
+        return [dict(entry) for entry in cached]
 
     def get_lineage(
         self,
@@ -717,53 +912,15 @@ class ManifestLoader:
 
         return result
 
-    def get_downstream_nodes(self, unique_id: str, max_depth: int | None = None, current_depth: int = 0) -> list[dict[str, Any]]:
-        """Get all downstream dependents of a node recursively.
+    def get_downstream_nodes(self, unique_id: str, max_depth: int | None = None) -> list[dict[str, Any]]:
+        """Get all downstream dependents of a node.
 
         Args:
             unique_id: The unique identifier of the node
             max_depth: Maximum depth to traverse (None for unlimited)
-            current_depth: Current recursion depth (internal use)
 
         Returns:
             List of dictionaries with downstream node info:
             {"unique_id": str, "name": str, "type": str, "distance": int}
         """
-        if not self._manifest:
-            raise RuntimeError("Manifest not loaded. Call load() first.")
-
-        if max_depth is not None and current_depth >= max_depth:
-            return []
-
-        child_map = self._manifest.get("child_map", {})
-        children = child_map.get(unique_id, [])
-
-        downstream: list[dict[str, Any]] = []
-        seen: set[str] = set()
-
-        for child_id in children:
-            if child_id in seen:
-                continue
-            seen.add(child_id)
-
-            node = self.get_node_by_unique_id(child_id)
-            if node:
-                resource_type = node.get("resource_type", "unknown")
-                downstream.append(
-                    {
-                        "unique_id": child_id,
-                        "name": node.get("name", ""),
-                        "type": resource_type,
-                        "distance": current_depth + 1,
-                    }
-                )
-
-                # Recurse
-                if max_depth is None or current_depth + 1 < max_depth:
-                    grandchildren = self.get_downstream_nodes(child_id, max_depth, current_depth + 1)
-                    for gc in grandchildren:
-                        if gc["unique_id"] not in seen:
-                            seen.add(str(gc["unique_id"]))
-                            downstream.append(gc)
-
-        return downstream
+        return self._traverse("child_map", unique_id, max_depth)
@@ -0,0 +1,118 @@
+"""
+FastMCP middleware for the dbt Core MCP server.
+
+Thin specializations of FastMCP's built-in middleware for this server's needs.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.server.middleware.rate_limiting import RateLimitingMiddleware, TokenBucketRateLimiter
+from mcp import McpError
+from mcp.types import CallToolRequestParams, ErrorData
+
+logger = logging.getLogger(__name__)
+
+
+class _LruLimiters(OrderedDict[str, TokenBucketRateLimiter]):
+    """Rate limiters by client id, created on first use; the least recently used are dropped beyond max_size."""
+
+    def __init__(self, factory: Callable[[], TokenBucketRateLimiter], max_size: int):
+        super().__init__()
+        self._factory = factory
+        self._max_size = max_size
+
+    def __getitem__(self, key: str) -> TokenBucketRateLimiter:
+        if key in self:
+            self.move_to_end(key)
+            return super().__getitem__(key)
+        limiter = self._factory()
+        self[key] = limiter
+        while len(self) > self._max_size:
+            self.popitem(last=False)
+        return limiter
+
+
+class PerSessionRateLimitingMiddleware(RateLimitingMiddleware):
+    """Token-bucket rate limiting with a separate bucket per MCP session.
+
+    FastMCP's RateLimitingMiddleware shares one bucket between all clients unless told how
+    to identify them, so one busy client could exhaust the budget of every other client.
+    Keying buckets by session id gives each connected session its own budget.
+
+    Session ids are never reused, so buckets are kept for the most recently active
+    max_sessions sessions only; an evicted session simply starts over with a full bucket.
+    """
+
+    def __init__(self, max_requests_per_second: float = 10.0, burst_capacity: int | None = None, max_sessions: int = 1024):
+        """Initialize per-session rate limiting middleware.
+
+        Args:
+            max_requests_per_second: Sustained requests per second allowed per session
+            burst_capacity: Maximum burst per session. If None, defaults to 2x max_requests_per_second
+            max_sessions: Maximum number of session buckets kept
+        """
+        super().__init__(max_requests_per_second=max_requests_per_second, burst_capacity=burst_capacity)
+        self.limiters = _LruLimiters(lambda: TokenBucketRateLimiter(self.burst_capacity, self.max_requests_per_second), max_sessions)
+
+    def _get_client_identifier(self, context: MiddlewareContext) -> str:
+        """Get the MCP session id of the request, or "global" outside a request context."""
+        if context.fastmcp_context is None:
+            return "global"
+        try:
+            return context.fastmcp_context.session_id
+        except ValueError:
+            # No active request (e.g. internal calls); fall back to the shared bucket
+            return "global"
+
+
+# JSON-RPC server-error code for "busy", distinct from the generic -32000 so clients can back off and retry
+_SERVER_BUSY_ERROR_CODE = -32029
+
+
+class ServerBusyError(McpError):
+    """Error raised when too many tool calls are already running or queued."""
+
+    def __init__(self, message: str = "Server busy, too many concurrent tool calls"):
+        super().__init__(ErrorData(code=_SERVER_BUSY_ERROR_CODE, message=message))
+
+
+class ConcurrencyMiddleware(Middleware):
+    """Cap the number of tool calls running at once, with a bounded wait queue.
+
+    Calls beyond max_concurrent wait their turn; once max_queue calls are already waiting,
+    further calls are rejected immediately instead of piling up behind long dbt commands.
+    """
+
+    def __init__(self, max_concurrent: int = 4, max_queue: int = 16):
+        """Initialize concurrency middleware.
+
+        Args:
+            max_concurrent: Maximum number of tool calls executing at the same time
+            max_queue: Maximum number of tool calls waiting for a free slot
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._waiting = 0
+
+    async def on_call_tool(self, context: MiddlewareContext[CallToolRequestParams], call_next: CallNext[CallToolRequestParams, Any]) -> Any:
+        """Run the tool call once a slot is free, or reject it if the queue is full."""
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            logger.warning(f"Rejecting tool call '{context.message.name}': {self._waiting} calls already queued")
+            raise ServerBusyError()
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            return await call_next(context)
+        finally:
+            self._semaphore.release()
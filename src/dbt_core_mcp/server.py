@@ -5,27 +5,127 @@ This server provides tools for interacting with dbt projects via the Model Conte
 """
 
 import asyncio
-import json
 import logging
 import os
 import shutil
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import unquote
 from urllib.request import url2pathname
 
-import yaml
 from fastmcp import FastMCP
 from fastmcp.server.context import Context
 from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
-from fastmcp.server.middleware.rate_limiting import RateLimitingMiddleware
 
-from .dbt.bridge_runner import BridgeRunner
-from .dbt.manifest import ManifestLoader
+from .dbt.manifest import ManifestLoader, load_json_file
+from .middleware import ConcurrencyMiddleware, PerSessionRateLimitingMiddleware
 from .utils.env_detector import detect_python_command
+from .utils.project_config import read_yaml_file
+
+if TYPE_CHECKING:
+    from .dbt.bridge_runner import BridgeRunner
 
 logger = logging.getLogger(__name__)
 
+# Files whose changes require a re-parse
+_SOURCE_FILE_SUFFIXES = (".sql", ".yml", ".yaml")
+
+# Manifest loaders shared by every server instance in the process, keyed by resolved manifest path.
+# A loader re-reads its file only when mtime/size change, so re-created servers (tests, workspace
+# switches) reuse the parsed manifest along with its lookup indexes and lineage memo.
+_MANIFEST_LOADERS: OrderedDict[Path, ManifestLoader] = OrderedDict()
+_MANIFEST_LOADERS_SIZE = 4
+
+
+@lru_cache(maxsize=1)
+def _default_profiles_dir() -> str:
+    """Return the expanded default dbt profiles directory (~/.dbt), resolved once per process."""
+    return os.path.expanduser("~/.dbt")
+
+
+@lru_cache(maxsize=1)
+def _get_error_handler() -> ErrorHandlingMiddleware:
+    """Return the process-wide error handling middleware, created on first server instantiation."""
+    return ErrorHandlingMiddleware()
+
+
+@lru_cache(maxsize=1)
+def _get_rate_limiter() -> PerSessionRateLimitingMiddleware:
+    """Return the process-wide rate limiting middleware (one bucket per MCP session), created on first server instantiation."""
+    return PerSessionRateLimitingMiddleware(max_requests_per_second=50)
+
+
+def _find_newer_source_file(root: Path, threshold: float) -> str | None:
+    """Find a dbt source file under root modified after threshold.
+
+    Walks the tree once with os.scandir (whose entries carry cached stat data) and stops at
+    the first newer file, instead of globbing the whole tree once per extension.
+
+    Args:
+        root: Directory to search recursively
+        threshold: Modification time (seconds since epoch) to compare against
+
+    Returns:
+        Path of the first newer .sql/.yml/.yaml file found, or None
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # Removed or unreadable while walking
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(_SOURCE_FILE_SUFFIXES) and entry.stat().st_mtime > threshold:
+                    return entry.path
+    return None
+
+
+def _find_newer_source_file_in(roots: list[Path], threshold: float) -> tuple[Path, str] | None:
+    """Find a dbt source file modified after threshold in any of several directories.
+
+    Directories are walked one after another and the walk stops at the first hit.
+
+    Args:
+        roots: Directories to search recursively
+        threshold: Modification time (seconds since epoch) to compare against
+
+    Returns:
+        (root, path) of the first newer file found, or None
+    """
+    for root in roots:
+        newer_file = _find_newer_source_file(root, threshold)
+        if newer_file:
+            return root, newer_file
+    return None
+
+
+def _get_manifest_loader(manifest_path: Path) -> ManifestLoader:
+    """Return the process-wide loader for a manifest path, creating it if needed.
+
+    Args:
+        manifest_path: Path to target/manifest.json
+
+    Returns:
+        Shared ManifestLoader for that path
+    """
+    key = manifest_path.resolve()
+    loader = _MANIFEST_LOADERS.get(key)
+    if loader is None:
+        loader = ManifestLoader(manifest_path)
+        _MANIFEST_LOADERS[key] = loader
+        while len(_MANIFEST_LOADERS) > _MANIFEST_LOADERS_SIZE:
+            _MANIFEST_LOADERS.popitem(last=False)
+    else:
+        _MANIFEST_LOADERS.move_to_end(key)
+    return loader
+
 
 class DbtCoreMcpServer:
     """
@@ -65,12 +165,13 @@ class DbtCoreMcpServer:
             on_duplicate_resources="warn",
             on_duplicate_prompts="replace",
             include_fastmcp_meta=True,  # Include FastMCP metadata for clients
+            lifespan=self._lifespan,
         )
 
         # Store the explicit project_dir if provided, otherwise will detect from workspace roots
         self._explicit_project_dir = Path(project_dir) if project_dir else None
         self.project_dir: Path | None = None
-        self.profiles_dir = os.path.expanduser("~/.dbt")
+        self.profiles_dir = _default_profiles_dir()
         self.timeout = timeout
 
         # Initialize dbt components (lazy-loaded)
@@ -82,8 +183,11 @@ class DbtCoreMcpServer:
         self._init_lock = asyncio.Lock()
 
         # Add built-in FastMCP middleware (2.11.0)
-        self.app.add_middleware(ErrorHandlingMiddleware())  # Handle errors first
-        self.app.add_middleware(RateLimitingMiddleware(max_requests_per_second=50))
+        # (shared across server instances rather than rebuilt for each one)
+        self.app.add_middleware(_get_error_handler())  # Handle errors first
+        self.app.add_middleware(_get_rate_limiter())
+        # Per instance: the semaphore belongs to the event loop serving this server
+        self.app.add_middleware(ConcurrencyMiddleware(max_concurrent=4, max_queue=16))
         # TimingMiddleware and LoggingMiddleware removed - they use structlog with column alignment
         # which causes formatting issues in VS Code's output panel
 
@@ -155,8 +259,7 @@ class DbtCoreMcpServer:
             return {}
 
         try:
-            with open(project_file) as f:
-                config = yaml.safe_load(f)
+            config = read_yaml_file(project_file)
 
             return {
                 "model-paths": config.get("model-paths", ["models"]),
@@ -195,25 +298,19 @@ class DbtCoreMcpServer:
         # Get configured paths from project
         project_paths = self._get_project_paths()
 
-        # Check all configured source directories
+        # Check all configured source directories (.sql, .yml and .yaml files)
+        source_dirs: dict[Path, str] = {}
         for path_type, paths in project_paths.items():
             for path_str in paths:
                 source_dir = self.project_dir / path_str
                 if source_dir.exists():
-                    # Check .sql files
-                    for sql_file in source_dir.rglob("*.sql"):
-                        if sql_file.stat().st_mtime > manifest_mtime:
-                            logger.debug(f"{path_type}: {sql_file.name} is newer than manifest")
-                            return True
-                    # Check .yml and .yaml files
-                    for yml_file in source_dir.rglob("*.yml"):
-                        if yml_file.stat().st_mtime > manifest_mtime:
-                            logger.debug(f"{path_type}: {yml_file.name} is newer than manifest")
-                            return True
-                    for yaml_file in source_dir.rglob("*.yaml"):
-                        if yaml_file.stat().st_mtime > manifest_mtime:
-                            logger.debug(f"{path_type}: {yaml_file.name} is newer than manifest")
-                            return True
+                    source_dirs[source_dir] = path_type
+
+        newer = _find_newer_source_file_in(list(source_dirs), manifest_mtime)
+        if newer:
+            source_dir, newer_file = newer
+            logger.debug(f"{source_dirs[source_dir]}: {os.path.basename(newer_file)} is newer than manifest")
+            return True
 
         return False
 
@@ -234,6 +331,8 @@ class DbtCoreMcpServer:
             logger.info(f"Detected Python command: {python_cmd}")
 
             # Create bridge runner
+            from .dbt.bridge_runner import BridgeRunner
+
             self.runner = BridgeRunner(self.project_dir, python_cmd, timeout=self.timeout)
 
         # Only parse if needed (manifest is stale or missing)
@@ -249,7 +348,8 @@ class DbtCoreMcpServer:
         # Initialize or reload manifest loader
         manifest_path = self.runner.get_manifest_path()
         if not self.manifest:
-            self.manifest = ManifestLoader(manifest_path)
+            logger.info(f"Loading manifest from {manifest_path}...")
+            self.manifest = _get_manifest_loader(manifest_path)
         await self.manifest.load()
 
         logger.info("dbt components initialized successfully")
@@ -274,6 +374,8 @@ class DbtCoreMcpServer:
             if detected_workspace and detected_workspace != self.project_dir:
                 logger.info(f"Workspace changed from {self.project_dir} to {detected_workspace}, reinitializing...")
                 self.project_dir = detected_workspace
+                # Stop the old project's dbt worker rather than orphaning it
+                await self.close()
                 self.runner = None
                 self.manifest = None
 
@@ -288,8 +390,8 @@ class DbtCoreMcpServer:
             if not self.project_dir:
                 raise RuntimeError("dbt project directory not set. The MCP server requires a workspace with a dbt_project.yml file.")
 
-            # Check if manifest is stale (time delta check)
-            needs_parse = self._is_manifest_stale()
+            # Check if manifest is stale (time delta check); walks the source tree, so off the event loop
+            needs_parse = await asyncio.to_thread(self._is_manifest_stale)
 
             # Initialize components if needed (first time or after workspace change)
             # Parse only if manifest is stale
@@ -315,8 +417,7 @@ class DbtCoreMcpServer:
             return {"results": [], "elapsed_time": 0}
 
         try:
-            with open(run_results_path) as f:
-                data = json.load(f)
+            data = load_json_file(run_results_path)
 
             # Simplify results for output
             simplified_results = []
@@ -354,8 +455,7 @@ class DbtCoreMcpServer:
 
         try:
             # Load state (before) manifest
-            with open(state_manifest_path) as f:
-                state_manifest = json.load(f)
+            state_manifest = load_json_file(state_manifest_path)
 
             # Load current (after) manifest
             if not self.manifest:
@@ -565,16 +665,21 @@ class DbtCoreMcpServer:
         except ValueError as e:
             raise ValueError(f"Resource not found: {e}")
 
-    async def toolImpl_list_resources(self, resource_type: str | None = None) -> list[dict[str, Any]]:
+    async def toolImpl_list_resources(self, resource_type: str | None = None, offset: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
         """Implementation for list_resources tool.
 
         Args:
             resource_type: Optional filter (model, source, seed, snapshot, test, analysis, macro)
+            offset: Number of resources to skip (for paging)
+            limit: Maximum number of resources to return (None = all remaining)
 
         Returns:
             List of resource dictionaries with consistent structure
         """
-        return self.manifest.get_resources(resource_type)  # type: ignore
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset and limit must be non-negative")
+
+        return self.manifest.get_resources(resource_type, offset, limit)  # type: ignore
 
     async def toolImpl_get_lineage(self, name: str, resource_type: str | None = None, direction: str = "both", depth: int | None = None) -> dict[str, Any]:
         """Implementation for get_lineage tool."""
@@ -593,10 +698,12 @@ class DbtCoreMcpServer:
     async def toolImpl_get_project_info(self, run_debug: bool = True) -> dict[str, Any]:
         """Implementation for get_project_info tool."""
         # Get project info from manifest
-        info = self.manifest.get_project_info()  # type: ignore
-        info["project_dir"] = str(self.project_dir)
-        info["profiles_dir"] = self.profiles_dir
-        info["status"] = "ready"
+        info: dict[str, Any] = {
+            **self.manifest.get_project_info(),  # type: ignore
+            "project_dir": str(self.project_dir),
+            "profiles_dir": str(self.runner.profiles_dir) if self.runner else self.profiles_dir,
+            "status": "ready",
+        }
 
         # Run full dbt debug if requested (default behavior)
         if run_debug:
@@ -1237,7 +1344,7 @@ Do you want to proceed?"""
             return await self.toolImpl_get_project_info(run_debug)
 
         @self.app.tool()
-        async def list_resources(ctx: Context, resource_type: str | None = None) -> list[dict[str, Any]]:
+        async def list_resources(ctx: Context, resource_type: str | None = None, offset: int = 0, limit: int | None = None) -> list[dict[str, Any]]:
             """List all resources in the dbt project with optional filtering by type.
 
             This unified tool provides a consistent view across all dbt resource types.
@@ -1253,6 +1360,10 @@ Do you want to proceed?"""
                     - "analysis": Ad-hoc analysis queries
                     - "macro": Jinja macros (includes macros from installed packages)
                     - None: Return all resources (default)
+                offset: Number of resources to skip (default: 0)
+                limit: Maximum number of resources to return (default: all).
+                    Page through large projects with offset=0, limit, then offset+limit, ...
+                    until fewer than limit resources come back.
 
             Returns:
                 List of resource dictionaries with consistent structure across types.
@@ -1278,9 +1389,11 @@ Do you want to proceed?"""
                 list_resources("source") -> only sources
                 list_resources("test") -> only tests
                 list_resources("macro") -> all macros (discover installed packages)
+                list_resources("model", limit=100) -> first 100 models
+                list_resources("model", offset=100, limit=100) -> next 100 models
             """
             await self._ensure_initialized_with_context(ctx)
-            return await self.toolImpl_list_resources(resource_type=resource_type)
+            return await self.toolImpl_list_resources(resource_type=resource_type, offset=offset, limit=limit)
 
         @self.app.tool()
         async def get_resource_info(
@@ -1674,6 +1787,22 @@ Do you want to proceed?"""
 
         logger.info("Registered dbt tools")
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastMCP[Any]) -> AsyncGenerator[None]:
+        """Stop the dbt worker process when the MCP server shuts down."""
+        try:
+            yield
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Shut down the dbt worker process, if one is running.
+
+        The runner stays usable: its next command starts a new worker.
+        """
+        if self.runner is not None:
+            await self.runner.close()
+
     def run(self) -> None:
         """Run the MCP server."""
         self.app.run(show_banner=False)
@@ -8,18 +8,30 @@ and environment variables to run Python in that environment.
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from .project_config import read_yaml_file
+
 logger = logging.getLogger(__name__)
 
+# Virtual environment directory names looked for in the project, in order of preference
+_VENV_NAMES = (".venv", "venv", "env")
+
+# Lock files that select an environment manager when no virtual environment is found
+_LOCK_FILES = ("uv.lock", "poetry.lock", "Pipfile.lock")
+
 
 def detect_python_command(project_dir: Path) -> list[str]:
     """
     Detect how to run Python in the project's environment.
 
     Detects common Python environment setups and returns the command prefix
-    needed to run Python in that environment.
+    needed to run Python in that environment. Results are cached per project
+    directory until one of the files detection looks at (venv interpreters and
+    pyvenv.cfg, lock files) is created, removed or replaced, or the active conda
+    environment changes.
 
     Args:
         project_dir: Path to the dbt project directory
@@ -35,39 +47,64 @@ def detect_python_command(project_dir: Path) -> list[str]:
     """
     # Convert to absolute path
     project_dir = project_dir.resolve()
+    return list(_detect_python_command(project_dir, _environment_stamp(project_dir), os.environ.get("CONDA_DEFAULT_ENV")))
 
+
+def _environment_stamp(project_dir: Path) -> tuple[int, ...]:
+    """Modification times of every file python command detection depends on (0 if missing).
+
+    Uses lstat, so recreating a venv's interpreter symlink counts as a change.
+    """
+    markers: list[Path] = []
+    for venv_name in _VENV_NAMES:
+        venv_path = project_dir / venv_name
+        markers.append(venv_path / "pyvenv.cfg")
+        markers.append(_get_venv_python(venv_path))
+    markers.extend(project_dir / lock_file for lock_file in _LOCK_FILES)
+
+    stamp: list[int] = []
+    for marker in markers:
+        try:
+            stamp.append(marker.lstat().st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+@lru_cache(maxsize=32)
+def _detect_python_command(project_dir: Path, environment_stamp: tuple[int, ...], conda_env: str | None) -> tuple[str, ...]:
+    """Cached detection behind detect_python_command(); environment_stamp and conda_env only key the cache."""
     # Check for standard venv (.venv or venv) - prefer this for uv projects to avoid VIRTUAL_ENV conflicts
     venv_path = _find_venv(project_dir)
     if venv_path:
         logger.info(f"Detected venv at {venv_path}")
         python_exe = _get_venv_python(venv_path)
-        return [str(python_exe)]
+        return (str(python_exe),)
 
     # Check for uv (uv.lock) - only if no venv found
     if (project_dir / "uv.lock").exists():
         logger.info(f"Detected uv environment in {project_dir}")
-        return ["uv", "run", "--directory", str(project_dir), "python"]
+        return ("uv", "run", "--directory", str(project_dir), "python")
 
     # Check for poetry (poetry.lock)
     if (project_dir / "poetry.lock").exists():
         logger.info(f"Detected poetry environment in {project_dir}")
-        return ["poetry", "run", "--directory", str(project_dir), "python"]
+        return ("poetry", "run", "--directory", str(project_dir), "python")
 
     # Check for pipenv (Pipfile.lock)
     if (project_dir / "Pipfile.lock").exists():
         logger.info(f"Detected pipenv environment in {project_dir}")
         # pipenv doesn't have --directory, need to cd first
-        return ["pipenv", "run", "python"]
+        return ("pipenv", "run", "python")
 
     # Check for conda environment
-    conda_env = os.environ.get("CONDA_DEFAULT_ENV")
     if conda_env:
         logger.info(f"Detected conda environment: {conda_env}")
-        return ["conda", "run", "-n", conda_env, "python"]
+        return ("conda", "run", "-n", conda_env, "python")
 
     # Fall back to system Python
     logger.warning(f"No virtual environment detected in {project_dir}, using system Python")
-    return [sys.executable]
+    return (sys.executable,)
 
 
 def get_env_vars(python_command: list[str]) -> dict[str, str] | None:
@@ -111,7 +148,7 @@ def get_env_vars(python_command: list[str]) -> dict[str, str] | None:
 
 def _find_venv(project_dir: Path) -> Optional[Path]:
     """Find a virtual environment directory."""
-    for venv_name in [".venv", "venv", "env"]:
+    for venv_name in _VENV_NAMES:
         venv_path = project_dir / venv_name
         if venv_path.is_dir() and _is_venv(venv_path):
             return venv_path
@@ -153,16 +190,11 @@ def detect_dbt_adapter(project_dir: Path) -> str:
         FileNotFoundError: If dbt_project.yml or profiles.yml not found
         KeyError: If required keys not found in YAML files
     """
-    import yaml
-
     # Read dbt_project.yml to get profile name
     project_yml_path = project_dir / "dbt_project.yml"
     if not project_yml_path.exists():
         raise FileNotFoundError(f"dbt_project.yml not found in {project_dir}")
 
-    project_yml = yaml.safe_load(project_yml_path.read_text())
-    profile_name = project_yml["profile"]
-
     # Find profiles.yml (project dir or ~/.dbt/)
     profiles_path = project_dir / "profiles.yml"
     if not profiles_path.exists():
@@ -171,8 +203,12 @@ def detect_dbt_adapter(project_dir: Path) -> str:
     if not profiles_path.exists():
         raise FileNotFoundError(f"profiles.yml not found in {project_dir} or ~/.dbt/")
 
+    # Both files are parsed once and reused until they change
+    project_yml = read_yaml_file(project_yml_path)
+    profile_name = project_yml["profile"]
+
     # Read profiles.yml and get adapter type
-    profiles = yaml.safe_load(profiles_path.read_text())
+    profiles = read_yaml_file(profiles_path)
     profile = profiles[profile_name]
 
     # Get target (default or first output)
@@ -0,0 +1,67 @@
+"""
+Cached YAML loading for dbt project files.
+
+dbt_project.yml and profiles.yml are read from several places (staleness checks,
+adapter detection, the bridge runner). Parsing goes through one cache keyed by file
+modification time, using PyYAML's C-backed loader when it is available.
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader is an order of magnitude faster; fall back when PyYAML was built without it
+_SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def read_yaml_file(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    The returned object is shared between callers and must not be modified.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file isn't valid YAML
+    """
+    stat = path.stat()
+    return _read_yaml_file(path.resolve(), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _read_yaml_file(path: Path, mtime_ns: int, size: int) -> Any:
+    """Cached parse behind read_yaml_file(); mtime_ns and size only key the cache."""
+    logger.debug(f"Parsing {path}")
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def load_project_config(project_dir: Path) -> dict[str, Any]:
+    """
+    Load dbt_project.yml for a project.
+
+    Args:
+        project_dir: Path to the dbt project directory
+
+    Returns:
+        Project configuration, or an empty dict if the file is missing or invalid
+    """
+    try:
+        config = read_yaml_file(project_dir / "dbt_project.yml")
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Failed to parse dbt_project.yml: {e}")
+        return {}
+    return config if isinstance(config, dict) else {}
@@ -2,9 +2,57 @@
 Pytest configuration and fixtures for dbt Core MCP tests.
 """
 
+import os
+import shutil
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
+import pytest_asyncio
+
+from dbt_core_mcp.dbt.runner import DbtRunnerResult
+
+if TYPE_CHECKING:
+    from dbt_core_mcp.server import DbtCoreMcpServer
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests marked requires_dbt_exec when SKIP_DBT_EXEC=1.
+
+    Only the explicit opt-out skips them: dbt runs in the example project's own environment,
+    not necessarily the one running pytest, so its absence here says nothing.
+    """
+    if os.environ.get("SKIP_DBT_EXEC") != "1":
+        return
+
+    skip_dbt_exec = pytest.mark.skip(reason="Runs dbt commands (SKIP_DBT_EXEC=1)")
+    for item in items:
+        if "requires_dbt_exec" in item.keywords:
+            item.add_marker(skip_dbt_exec)
+
+
+class StubRunner:
+    """No-op stand-in for BridgeRunner in tests that only need a runner to be present."""
+
+    def __init__(self, project_dir: Path | None = None) -> None:
+        self.project_dir = project_dir
+        self.closed = False
+
+    async def invoke(self, args: list[str]) -> DbtRunnerResult:
+        return DbtRunnerResult(success=True)
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def get_manifest_path(self) -> Path:
+        assert self.project_dir is not None
+        return self.project_dir / "target" / "manifest.json"
+
+
+@pytest.fixture
+def stub_runner() -> StubRunner:
+    """Provide a StubRunner; tests set its project_dir when they need manifest paths."""
+    return StubRunner()
 
 
 @pytest.fixture
@@ -64,16 +112,60 @@ test_profile:
     return str(profiles_dir)
 
 
-@pytest.fixture
-async def jaffle_shop_server():
-    """Create a server instance with the jaffle_shop example project."""
-    from pathlib import Path
+_JAFFLE_SHOP_DIR = Path(__file__).parent.parent / "examples" / "jaffle_shop"
+
+
+@pytest.fixture(scope="session")
+def jaffle_shop_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path of the jaffle_shop project the tests run against.
+
+    Under pytest-xdist each worker gets its own copy, so parallel dbt runs don't share
+    target/ or lock the same DuckDB file. Build output isn't copied, and any virtualenv is
+    symlinked rather than copied so every copy runs dbt in the original project's environment.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        return _JAFFLE_SHOP_DIR
+    project_dir = tmp_path_factory.mktemp("jaffle_shop") / "jaffle_shop"
+    shutil.copytree(_JAFFLE_SHOP_DIR, project_dir, ignore=shutil.ignore_patterns(".venv", "venv", "target", "logs"))
+    for venv_name in (".venv", "venv"):
+        if (_JAFFLE_SHOP_DIR / venv_name).is_dir():
+            (project_dir / venv_name).symlink_to(_JAFFLE_SHOP_DIR / venv_name, target_is_directory=True)
+    return project_dir
+
+
+@pytest_asyncio.fixture(scope="session")
+async def jaffle_shop_server(jaffle_shop_dir: Path):
+    """Create a server instance with the jaffle_shop example project.
 
+    Shared by the whole session: the project is parsed and the manifest loaded once, and
+    tests that change project state rely on the server's own staleness checks to reload.
+    """
     from dbt_core_mcp.server import create_server
 
     # Use the example jaffle_shop project
-    project_dir = Path(__file__).parent.parent / "examples" / "jaffle_shop"
-    server = create_server(str(project_dir))
+    server = create_server(str(jaffle_shop_dir))
     # Initialize with a mock context (no workspace roots for tests)
     await server._ensure_initialized_with_context(None)  # pyright: ignore[reportPrivateUsage]
-    return server
+    yield server
+
+    # Stop the dbt worker process so it doesn't outlive the test
+    await server.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def seeded_jaffle_shop_server(jaffle_shop_server: "DbtCoreMcpServer") -> "DbtCoreMcpServer":
+    """Jaffle shop server with seeds loaded, since models depend on them.
+
+    Seeds are loaded once per session; later runs and builds only read the seed tables.
+    """
+    await jaffle_shop_server.toolImpl_seed_data()
+    return jaffle_shop_server
+
+
+@pytest.fixture
+def clean_state_dir(jaffle_shop_server: "DbtCoreMcpServer") -> Path:
+    """Remove the saved run state (target/state_last_run) so the test starts without one."""
+    assert jaffle_shop_server.project_dir is not None
+    state_dir = jaffle_shop_server.project_dir / "target" / "state_last_run"
+    shutil.rmtree(state_dir, ignore_errors=True)
+    return state_dir
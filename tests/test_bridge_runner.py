@@ -0,0 +1,91 @@
+"""Tests for BridgeRunner invocation helpers."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from dbt_core_mcp.dbt.bridge_runner import _RESULT_MARKER, _STDERR_END_MARKER, BridgeRunner  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.requires_dbt_exec
+async def test_invoke_reuses_and_restarts_worker(jaffle_shop_dir: Path) -> None:
+    """Test that commands share one worker process, which is restarted after it dies."""
+    runner = BridgeRunner(jaffle_shop_dir, [sys.executable])
+
+    try:
+        first = await runner.invoke(["debug"])
+        assert first.success
+        assert "All checks passed" in first.stdout
+        worker = runner._worker  # pyright: ignore[reportPrivateUsage]
+        assert worker is not None
+
+        await runner.invoke(["debug"])
+        assert runner._worker is worker  # pyright: ignore[reportPrivateUsage]
+
+        worker.kill()
+        await worker.wait()
+
+        assert (await runner.invoke(["debug"])).success
+        assert runner._worker is not worker  # pyright: ignore[reportPrivateUsage]
+    finally:
+        await runner.close()
+
+
+async def test_failed_command_waits_for_complete_stderr(tmp_path: Path) -> None:
+    """Test that a failed command's stderr is collected up to the worker's end marker, even if it arrives after the result."""
+    # Prints the result first and its stderr a moment later, so only waiting for the marker sees the error
+    fake_worker = (
+        "import sys, time\n"
+        "for line in sys.stdin:\n"
+        f"    sys.stdout.write('\\n{_RESULT_MARKER}' + '{{\"success\": false}}' + '\\n')\n"
+        "    sys.stdout.flush()\n"
+        "    time.sleep(0.2)\n"
+        "    sys.stderr.write('Compilation Error: boom\\n')\n"
+        f"    sys.stderr.write('\\n{_STDERR_END_MARKER}\\n')\n"
+        "    sys.stderr.flush()\n"
+    )
+    runner = BridgeRunner(tmp_path, [sys.executable])
+    runner._worker_command = [sys.executable, "-u", "-c", fake_worker]  # pyright: ignore[reportPrivateUsage]
+
+    try:
+        for _ in range(2):
+            result = await runner.invoke(["run"])
+            assert not result.success
+            assert "Compilation Error: boom" in result.stderr
+            assert _STDERR_END_MARKER not in result.stderr
+    finally:
+        await runner.close()
+
+
+def test_worker_lock_created_per_event_loop(tmp_path: Path) -> None:
+    """Test that the runner can be built outside a loop and used from successive event loops."""
+    fake_worker = f"import sys\nfor line in sys.stdin:\n    sys.stderr.write('{_STDERR_END_MARKER}\\n')\n    print('\\n{_RESULT_MARKER}' + '{{\"success\": true}}', flush=True)\n"
+    runner = BridgeRunner(tmp_path, [sys.executable])
+    runner._worker_command = [sys.executable, "-u", "-c", fake_worker]  # pyright: ignore[reportPrivateUsage]
+
+    async def run_once() -> asyncio.Lock | None:
+        try:
+            assert (await runner.invoke(["run"])).success
+        finally:
+            await runner.close()
+        return runner._worker_lock  # pyright: ignore[reportPrivateUsage]
+
+    first_lock = asyncio.run(run_once())
+    second_lock = asyncio.run(run_once())
+    assert first_lock is not None and second_lock is not None
+    assert first_lock is not second_lock
+
+
+def test_profiles_dir_precedence(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that DBT_PROFILES_DIR wins over a project-local profiles.yml, which wins over ~/.dbt."""
+    monkeypatch.delenv("DBT_PROFILES_DIR", raising=False)
+    assert BridgeRunner(tmp_path, [sys.executable]).profiles_dir == Path.home() / ".dbt"
+
+    (tmp_path / "profiles.yml").write_text("")
+    assert BridgeRunner(tmp_path, [sys.executable]).profiles_dir == tmp_path.resolve()
+
+    env_dir = tmp_path / "env_profiles"
+    monkeypatch.setenv("DBT_PROFILES_DIR", str(env_dir))
+    assert BridgeRunner(tmp_path, [sys.executable]).profiles_dir == env_dir.resolve()
@@ -0,0 +1,52 @@
+"""Tests for environment detection utilities."""
+
+from pathlib import Path
+
+import pytest
+
+from dbt_core_mcp.utils.env_detector import detect_dbt_adapter, detect_python_command
+
+
+def test_detect_python_command_follows_project_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that cached detection is refreshed when environment markers appear in the project."""
+    monkeypatch.delenv("CONDA_DEFAULT_ENV", raising=False)
+    (tmp_path / "poetry.lock").write_text("")
+
+    assert detect_python_command(tmp_path)[0] == "poetry"
+    assert detect_python_command(tmp_path) == detect_python_command(tmp_path)
+
+    venv = tmp_path / ".venv"
+    venv.mkdir()
+    (venv / "pyvenv.cfg").write_text("")
+    # Adding a venv marker invalidates the cached result
+    assert detect_python_command(tmp_path)[0].startswith(str(venv))
+
+
+def test_detect_python_command_follows_changes_inside_existing_venv_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that populating an existing .venv directory is picked up, though the project dir's mtime is unchanged."""
+    monkeypatch.delenv("CONDA_DEFAULT_ENV", raising=False)
+    (tmp_path / "poetry.lock").write_text("")
+    venv = tmp_path / ".venv"
+    venv.mkdir()  # not a venv yet: no pyvenv.cfg or interpreter
+
+    assert detect_python_command(tmp_path)[0] == "poetry"
+
+    project_mtime = tmp_path.stat().st_mtime_ns
+    (venv / "pyvenv.cfg").write_text("")
+    assert tmp_path.stat().st_mtime_ns == project_mtime
+    assert detect_python_command(tmp_path)[0].startswith(str(venv))
+
+
+def test_detect_dbt_adapter_follows_profile_changes(tmp_path: Path) -> None:
+    """Test that the cached adapter type is refreshed when profiles.yml changes."""
+    import os
+
+    (tmp_path / "dbt_project.yml").write_text("name: p\nprofile: p\n")
+    profiles = tmp_path / "profiles.yml"
+    profiles.write_text("p:\n  target: dev\n  outputs:\n    dev:\n      type: duckdb\n")
+    os.utime(profiles, ns=(1_000_000_000, 1_000_000_000))
+    assert detect_dbt_adapter(tmp_path) == "duckdb"
+
+    profiles.write_text("p:\n  target: dev\n  outputs:\n    dev:\n      type: postgres\n")
+    os.utime(profiles, ns=(2_000_000_000, 2_000_000_000))
+    assert detect_dbt_adapter(tmp_path) == "postgres"
@@ -1,11 +1,15 @@
 """
-Tests for ManifestLoader helper methods (get_resource_node).
+Tests for ManifestLoader helper methods (load, get_resource_node, iteration, lineage traversal).
 """
 
+import json
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+from dbt_core_mcp.dbt.manifest import _MANIFEST_CACHE, ManifestLoader, _read_manifest_file  # pyright: ignore[reportPrivateUsage]
+
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
@@ -70,3 +74,97 @@ def test_get_resource_node_invalid_type(jaffle_shop_server: "DbtCoreMcpServer")
     with pytest.raises(ValueError, match="Invalid resource_type"):
         jaffle_shop_server.manifest.get_resource_node("customers", "invalid_type")
 
+
+# Loading Tests
+
+
+async def test_load_skips_unchanged_manifest(tmp_path: Path) -> None:
+    """Test that load() reuses parsed data until manifest.json changes on disk."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"metadata": {}, "nodes": {}, "sources": {}}')
+
+    loader = ManifestLoader(manifest_path)
+    await loader.load()
+    first = loader.get_manifest_dict()
+
+    await loader.load()
+    assert loader.get_manifest_dict() is first
+
+    manifest_path.write_text('{"metadata": {"project_name": "changed"}, "nodes": {}, "sources": {}}')
+    await loader.load()
+    assert loader.get_manifest_dict() is not first
+    assert loader.get_project_info()["project_name"] == "changed"
+
+
+async def test_load_shares_parsed_manifest_across_loaders(tmp_path: Path) -> None:
+    """Test that a second loader for an unchanged manifest reuses the already-parsed data."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"metadata": {"project_name": "shared"}, "nodes": {}, "sources": {}}')
+
+    first = ManifestLoader(manifest_path)
+    await first.load()
+    second = ManifestLoader(manifest_path)
+    await second.load()
+
+    assert second.get_manifest_dict() is first.get_manifest_dict()
+    assert second.get_project_info()["project_name"] == "shared"
+
+
+def test_read_manifest_file_keeps_only_newest_version(tmp_path: Path) -> None:
+    """Test that the parsed-manifest cache reuses a parse per file and keeps only the newest version."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"metadata": {"project_name": "cached"}, "nodes": {}, "sources": {}}')
+    stat = manifest_path.stat()
+
+    parsed = _read_manifest_file(manifest_path, stat.st_mtime_ns, stat.st_size)
+    assert parsed["metadata"]["project_name"] == "cached"
+    assert _read_manifest_file(manifest_path, stat.st_mtime_ns, stat.st_size) is parsed
+
+    # A different file version is read from disk again and replaces the cached one
+    reparsed = _read_manifest_file(manifest_path, stat.st_mtime_ns + 1, stat.st_size)
+    assert reparsed == parsed
+    assert reparsed is not parsed
+    assert _MANIFEST_CACHE[manifest_path] == (stat.st_mtime_ns + 1, stat.st_size, reparsed)
+    assert _read_manifest_file(manifest_path, stat.st_mtime_ns, stat.st_size) is not parsed
+
+
+async def test_get_resources_cached_until_reload(tmp_path: Path) -> None:
+    """Test that get_resources() reuses its result until the manifest changes."""
+    manifest_path = tmp_path / "manifest.json"
+    nodes = {"model.p.a": {"name": "a", "resource_type": "model"}}
+    manifest_path.write_text(json.dumps({"metadata": {}, "nodes": nodes, "sources": {}}))
+
+    loader = ManifestLoader(manifest_path)
+    await loader.load()
+    first = loader.get_resources("model")
+    first.clear()  # callers own the returned list
+    assert [r["name"] for r in loader.get_resources("model")] == ["a"]
+
+    nodes["model.p.b"] = {"name": "b", "resource_type": "model"}
+    manifest_path.write_text(json.dumps({"metadata": {}, "nodes": nodes, "sources": {}}))
+    await loader.load()
+    assert [r["name"] for r in loader.get_resources("model")] == ["a", "b"]
+    assert [r["name"] for r in loader.get_resources("model", offset=1)] == ["b"]
+    assert [r["name"] for r in loader.get_resources("model", limit=1)] == ["a"]
+
+
+# Traversal Tests
+
+
+async def test_upstream_traversal_diamond(tmp_path: Path) -> None:
+    """Test that shared ancestors are reported once at their shortest distance."""
+    manifest_path = tmp_path / "manifest.json"
+    nodes = {f"model.p.{n}": {"name": n, "resource_type": "model"} for n in ("a", "b", "c", "d")}
+    # d -> b -> a, d -> c -> a, d -> a
+    parent_map = {"model.p.d": ["model.p.b", "model.p.c", "model.p.a"], "model.p.b": ["model.p.a"], "model.p.c": ["model.p.a"], "model.p.a": []}
+    manifest_path.write_text(json.dumps({"metadata": {}, "nodes": nodes, "sources": {}, "parent_map": parent_map}))
+
+    loader = ManifestLoader(manifest_path)
+    await loader.load()
+
+    upstream = loader.get_upstream_nodes("model.p.d")
+    assert [n["name"] for n in upstream] == ["b", "c", "a"]
+    assert all(n["distance"] == 1 for n in upstream)
+
+    limited = loader.get_upstream_nodes("model.p.b", max_depth=0)
+    assert limited == []
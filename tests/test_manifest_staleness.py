@@ -7,20 +7,28 @@ and needs regeneration, versus when it can reuse an existing manifest.
 
 import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
+if TYPE_CHECKING:
+    from conftest import StubRunner
 
-async def test_manifest_not_stale_when_exists_and_fresh() -> None:
+    from dbt_core_mcp.server import DbtCoreMcpServer
+
+
+async def test_manifest_not_stale_when_exists_and_fresh(jaffle_shop_server: "DbtCoreMcpServer", stub_runner: "StubRunner") -> None:
     """Test that staleness check returns False when manifest exists and is fresh."""
     from dbt_core_mcp.server import DbtCoreMcpServer
 
-    # Use the real jaffle_shop example project
-    project_dir = Path(__file__).parent.parent / "examples" / "jaffle_shop"
+    # Use the real jaffle_shop example project, already parsed by the shared server
+    project_dir = jaffle_shop_server.project_dir
+    assert project_dir is not None
     server = DbtCoreMcpServer(str(project_dir))
 
     # Set project_dir and create a mock runner (to pass the initial check)
     server.project_dir = project_dir
-    server.runner = MagicMock()  # Mock runner so we can check staleness
+    stub_runner.project_dir = project_dir
+    server.runner = stub_runner  # pyright: ignore[reportAttributeAccessIssue]
 
     # Verify manifest exists
     manifest_path = project_dir / "target" / "manifest.json"
@@ -33,14 +41,15 @@ async def test_manifest_not_stale_when_exists_and_fresh() -> None:
     assert not is_stale, "Manifest should not be stale when it exists and is fresh"
 
 
-async def test_manifest_stale_when_missing() -> None:
+async def test_manifest_stale_when_missing(jaffle_shop_dir: Path, stub_runner: "StubRunner") -> None:
     """Test that staleness check returns True when manifest doesn't exist."""
     from dbt_core_mcp.server import DbtCoreMcpServer
 
-    project_dir = Path(__file__).parent.parent / "examples" / "jaffle_shop"
+    project_dir = jaffle_shop_dir
     server = DbtCoreMcpServer(str(project_dir))
     server.project_dir = project_dir
-    server.runner = MagicMock()
+    stub_runner.project_dir = project_dir
+    server.runner = stub_runner  # pyright: ignore[reportAttributeAccessIssue]
 
     # Mock manifest path to simulate it doesn't exist
     with patch.object(Path, "exists", return_value=False):
@@ -48,7 +57,7 @@ async def test_manifest_stale_when_missing() -> None:
         assert is_stale, "Manifest should be stale when it doesn't exist"
 
 
-async def test_manifest_stale_when_project_file_newer(tmp_path: Path) -> None:
+async def test_manifest_stale_when_project_file_newer(tmp_path: Path, stub_runner: "StubRunner") -> None:
     """Test that staleness check returns True when dbt_project.yml is newer."""
     from dbt_core_mcp.server import DbtCoreMcpServer
 
@@ -79,14 +88,15 @@ model-paths: ["models"]
     # Initialize server
     server = DbtCoreMcpServer(str(project_dir))
     server.project_dir = project_dir
-    server.runner = MagicMock()
+    stub_runner.project_dir = project_dir
+    server.runner = stub_runner  # pyright: ignore[reportAttributeAccessIssue]
 
     # Check staleness - should be True since project file is newer
     is_stale = server._is_manifest_stale()  # pyright: ignore[reportPrivateUsage]
     assert is_stale, "Manifest should be stale when dbt_project.yml is newer"
 
 
-async def test_manifest_stale_when_model_file_newer(tmp_path: Path) -> None:
+async def test_manifest_stale_when_model_file_newer(tmp_path: Path, stub_runner: "StubRunner") -> None:
     """Test that staleness check returns True when a model file is newer."""
     from dbt_core_mcp.server import DbtCoreMcpServer
 
@@ -123,14 +133,52 @@ model-paths: ["models"]
     # Initialize server
     server = DbtCoreMcpServer(str(project_dir))
     server.project_dir = project_dir
-    server.runner = MagicMock()
+    stub_runner.project_dir = project_dir
+    server.runner = stub_runner  # pyright: ignore[reportAttributeAccessIssue]
 
     # Check staleness - should be True since model file is newer
     is_stale = server._is_manifest_stale()  # pyright: ignore[reportPrivateUsage]
     assert is_stale, "Manifest should be stale when model file is newer"
 
 
-async def test_staleness_check_before_runner_initialized() -> None:
+def test_newer_source_file_found_in_nested_directories(tmp_path: Path) -> None:
+    """Test that the source scan descends into subdirectories and only considers dbt source files."""
+    import os
+
+    from dbt_core_mcp.server import _find_newer_source_file  # pyright: ignore[reportPrivateUsage]
+
+    nested = tmp_path / "staging" / "jaffle"
+    nested.mkdir(parents=True)
+    (tmp_path / "old_model.sql").write_text("SELECT 1")
+    (nested / "notes.txt").write_text("not a dbt file")
+    os.utime(tmp_path / "old_model.sql", (1000, 1000))
+
+    assert _find_newer_source_file(tmp_path, 2000) is None
+
+    schema_file = nested / "schema.yaml"
+    schema_file.write_text("version: 2")
+    assert _find_newer_source_file(tmp_path, 2000) == str(schema_file)
+
+
+def test_newer_source_file_found_across_roots(tmp_path: Path) -> None:
+    """Test that the scan over several source directories reports the directory with the newer file."""
+    import os
+
+    from dbt_core_mcp.server import _find_newer_source_file_in  # pyright: ignore[reportPrivateUsage]
+
+    roots = [tmp_path / name for name in ("models", "seeds", "macros")]
+    for root in roots:
+        root.mkdir()
+        (root / "old.sql").write_text("SELECT 1")
+        os.utime(root / "old.sql", (1000, 1000))
+
+    assert _find_newer_source_file_in(roots, 2000) is None
+
+    (roots[1] / "new.yml").write_text("version: 2")
+    assert _find_newer_source_file_in(roots, 2000) == (roots[1], str(roots[1] / "new.yml"))
+
+
+async def test_staleness_check_before_runner_initialized(jaffle_shop_server: "DbtCoreMcpServer") -> None:
     """Test that _ensure_initialized_with_context doesn't parse when manifest is fresh.
 
     This is the key test that demonstrates the bug: currently, the first initialization
@@ -139,7 +187,9 @@ async def test_staleness_check_before_runner_initialized() -> None:
     """
     from dbt_core_mcp.server import create_server
 
-    project_dir = Path(__file__).parent.parent / "examples" / "jaffle_shop"
+    # Already parsed by the shared server
+    project_dir = jaffle_shop_server.project_dir
+    assert project_dir is not None
 
     # Verify manifest exists and is fresh
     manifest_path = project_dir / "target" / "manifest.json"
@@ -181,7 +231,7 @@ async def test_staleness_check_before_runner_initialized() -> None:
     assert not parse_called, "dbt parse should not be called when manifest is fresh"
 
 
-async def test_staleness_check_independent_of_runner_state() -> None:
+async def test_staleness_check_independent_of_runner_state(jaffle_shop_server: "DbtCoreMcpServer") -> None:
     """Verify that _is_manifest_stale() checks timestamps regardless of runner state.
 
     After the fix, _is_manifest_stale() should check manifest existence and timestamps
@@ -190,7 +240,9 @@ async def test_staleness_check_independent_of_runner_state() -> None:
     """
     from dbt_core_mcp.server import DbtCoreMcpServer
 
-    project_dir = Path(__file__).parent.parent / "examples" / "jaffle_shop"
+    # Already parsed by the shared server
+    project_dir = jaffle_shop_server.project_dir
+    assert project_dir is not None
 
     # Verify manifest exists
     manifest_path = project_dir / "target" / "manifest.json"
@@ -350,3 +402,29 @@ test_profile:
         mock.side_effect = mock_invoke
         await server._ensure_initialized_with_context(None)  # pyright: ignore[reportPrivateUsage]
         assert parse_count == initial_count, "Should not parse again when nothing changed"
+
+
+async def test_edit_right_after_fresh_verdict_is_detected(tmp_path: Path, stub_runner: "StubRunner") -> None:
+    """Test that an initialized server notices a model edit made right after a fresh verdict."""
+    from dbt_core_mcp.server import DbtCoreMcpServer
+
+    project_dir = tmp_path / "test_project"
+    (project_dir / "models").mkdir(parents=True)
+    (project_dir / "dbt_project.yml").write_text("name: 'test_project'\nmodel-paths: ['models']\n")
+    model_file = project_dir / "models" / "test_model.sql"
+    model_file.write_text("SELECT 1 as id")
+    (project_dir / "target").mkdir()
+    (project_dir / "target" / "manifest.json").write_text('{"metadata": {}, "nodes": {}}')
+
+    server = DbtCoreMcpServer(str(project_dir))
+    server.project_dir = project_dir
+    stub_runner.project_dir = project_dir
+    server.runner = stub_runner  # pyright: ignore[reportAttributeAccessIssue]
+    server.manifest = MagicMock()
+
+    assert not server._is_manifest_stale()  # pyright: ignore[reportPrivateUsage]
+
+    # A save straight after a fresh verdict must not be masked by that verdict
+    await asyncio.sleep(0.01)
+    model_file.touch()
+    assert server._is_manifest_stale()  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,76 @@
+"""
+Tests for the server's FastMCP middleware.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from fastmcp.server.middleware import MiddlewareContext
+from fastmcp.server.middleware.rate_limiting import RateLimitError
+from mcp.types import CallToolRequestParams
+
+from dbt_core_mcp.middleware import ConcurrencyMiddleware, PerSessionRateLimitingMiddleware, ServerBusyError
+
+
+def _context(session_id: str | None) -> MiddlewareContext[Any]:
+    fastmcp_context = SimpleNamespace(session_id=session_id) if session_id else None
+    return MiddlewareContext(message=None, fastmcp_context=fastmcp_context)  # type: ignore[arg-type]
+
+
+async def test_rate_limit_is_per_session() -> None:
+    """Test that one session exhausting its budget doesn't throttle another session."""
+    middleware = PerSessionRateLimitingMiddleware(max_requests_per_second=0.001, burst_capacity=1)
+    call_next = AsyncMock(return_value="ok")
+
+    assert await middleware.on_request(_context("a"), call_next) == "ok"
+    with pytest.raises(RateLimitError):
+        await middleware.on_request(_context("a"), call_next)
+
+    assert await middleware.on_request(_context("b"), call_next) == "ok"
+    assert await middleware.on_request(_context(None), call_next) == "ok"
+
+
+async def test_rate_limit_buckets_bounded_per_session() -> None:
+    """Test that only the most recently active sessions keep a bucket."""
+    middleware = PerSessionRateLimitingMiddleware(max_requests_per_second=0.001, burst_capacity=1, max_sessions=2)
+    call_next = AsyncMock(return_value="ok")
+
+    await middleware.on_request(_context("a"), call_next)
+    await middleware.on_request(_context("b"), call_next)
+    with pytest.raises(RateLimitError):
+        await middleware.on_request(_context("a"), call_next)  # keeps "a" recently used
+
+    await middleware.on_request(_context("c"), call_next)
+    assert list(middleware.limiters) == ["a", "c"]
+
+
+async def test_concurrency_limit_queues_then_rejects() -> None:
+    """Test that calls beyond the limit wait, and calls beyond the queue are rejected."""
+    middleware = ConcurrencyMiddleware(max_concurrent=1, max_queue=1)
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def call_next(context: MiddlewareContext[CallToolRequestParams]) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return "ok"
+
+    context = MiddlewareContext(message=CallToolRequestParams(name="tool", arguments={}))
+    first = asyncio.create_task(middleware.on_call_tool(context, call_next))
+    second = asyncio.create_task(middleware.on_call_tool(context, call_next))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServerBusyError) as exc_info:
+        await middleware.on_call_tool(context, call_next)
+    assert exc_info.value.error.code == -32029
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["ok", "ok"]
+    assert peak == 1
@@ -26,10 +26,10 @@ def test_wait_for_dbt_completion_no_process(tmp_path: Path) -> None:
     assert elapsed < 1.0  # Should return almost immediately
 
 
-@pytest.mark.skipif(not Path("examples/jaffle_shop").exists(), reason="Requires jaffle_shop example")
-def test_is_dbt_running_with_actual_process() -> None:
+@pytest.mark.requires_dbt_exec
+def test_is_dbt_running_with_actual_process(jaffle_shop_dir: Path) -> None:
     """Test detecting an actual dbt process (integration test)."""
-    project_dir = Path("examples/jaffle_shop").resolve()
+    project_dir = jaffle_shop_dir.resolve()
 
     # Start a long-running dbt command in background
     # Use 'dbt debug' as it's relatively harmless and takes some time
@@ -0,0 +1,28 @@
+"""Tests for cached dbt project YAML loading."""
+
+import os
+from pathlib import Path
+
+from dbt_core_mcp.utils.project_config import load_project_config, read_yaml_file
+
+
+def test_read_yaml_file_reuses_parse_until_changed(tmp_path: Path) -> None:
+    """Test that an unchanged file is parsed once and a modified file is parsed again."""
+    project_file = tmp_path / "dbt_project.yml"
+    project_file.write_text("name: first\n")
+    os.utime(project_file, ns=(1_000_000_000, 1_000_000_000))
+
+    first = read_yaml_file(project_file)
+    assert read_yaml_file(project_file) is first
+
+    project_file.write_text("name: second\n")
+    os.utime(project_file, ns=(2_000_000_000, 2_000_000_000))
+    assert read_yaml_file(project_file) == {"name": "second"}
+
+
+def test_load_project_config_missing_or_invalid(tmp_path: Path) -> None:
+    """Test that a missing or malformed dbt_project.yml yields an empty config."""
+    assert load_project_config(tmp_path) == {}
+
+    (tmp_path / "dbt_project.yml").write_text("name: [unclosed\n")
+    assert load_project_config(tmp_path) == {}
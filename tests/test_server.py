@@ -2,8 +2,17 @@
 Basic integration test for dbt Core MCP server.
 """
 
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+
 from dbt_core_mcp.server import create_server
 
+if TYPE_CHECKING:
+    from conftest import StubRunner
+
 
 def test_server_creation() -> None:
     """Test that server can be created."""
@@ -12,3 +21,31 @@ def test_server_creation() -> None:
     assert server.app is not None
     assert server.project_dir is None  # No project dir when created without argument
     assert server.profiles_dir is not None
+
+
+async def test_workspace_change_closes_previous_runner(tmp_path: Path, stub_runner: "StubRunner", monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that switching workspace roots stops the old project's dbt worker."""
+    server = create_server()
+    server.project_dir = tmp_path / "old_project"
+    server.runner = stub_runner  # pyright: ignore[reportAttributeAccessIssue]
+
+    new_project = tmp_path / "new_project"
+    monkeypatch.setattr(server, "_detect_workspace_roots", AsyncMock(return_value=new_project))
+    monkeypatch.setattr(server, "_is_manifest_stale", lambda: False)
+    monkeypatch.setattr(server, "_initialize_dbt_components", AsyncMock())
+
+    await server._ensure_initialized_with_context(None)  # pyright: ignore[reportPrivateUsage]
+
+    assert stub_runner.closed
+    assert server.project_dir == new_project
+
+
+async def test_lifespan_closes_runner(stub_runner: "StubRunner") -> None:
+    """Test that the server's lifespan stops the dbt worker on shutdown."""
+    server = create_server()
+    server.runner = stub_runner  # pyright: ignore[reportAttributeAccessIssue]
+
+    async with server._lifespan(server.app):  # pyright: ignore[reportPrivateUsage]
+        assert not stub_runner.closed
+
+    assert stub_runner.closed
@@ -1,5 +1,6 @@
 """Tests for build_models tool."""
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
@@ -7,15 +8,11 @@ import pytest
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
-
-@pytest.fixture
-async def seeded_jaffle_shop_server(jaffle_shop_server: "DbtCoreMcpServer"):
-    """Jaffle shop server with seeds already loaded."""
-    # Load seeds first since build depends on them
-    await jaffle_shop_server.toolImpl_seed_data()
-    return jaffle_shop_server
+# These tests run dbt commands that write to target/ and the DuckDB file; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("dbt_state")
 
 
+@pytest.mark.requires_dbt_exec
 async def test_build_all_models(seeded_jaffle_shop_server: "DbtCoreMcpServer"):
     """Test building all models (run + test in DAG order)."""
     result = await seeded_jaffle_shop_server.toolImpl_build_models(ctx=None)
@@ -34,6 +31,7 @@ async def test_build_all_models(seeded_jaffle_shop_server: "DbtCoreMcpServer"):
         assert r["status"] in ["success", "pass"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_build_select_specific(seeded_jaffle_shop_server: "DbtCoreMcpServer"):
     """Test building a specific model."""
     result = await seeded_jaffle_shop_server.toolImpl_build_models(ctx=None, select="customers")
@@ -49,22 +47,15 @@ async def test_build_invalid_combination(jaffle_shop_server: "DbtCoreMcpServer")
         await jaffle_shop_server.toolImpl_build_models(ctx=None, select="customers", modified_only=True)
 
 
-async def test_build_modified_only_requires_state(jaffle_shop_server: "DbtCoreMcpServer"):
+async def test_build_modified_only_requires_state(jaffle_shop_server: "DbtCoreMcpServer", clean_state_dir: Path):
     """Test that modified_only requires previous state."""
-    # Remove state if it exists
-    assert jaffle_shop_server.project_dir is not None
-    state_dir = jaffle_shop_server.project_dir / "target" / "state_last_run"
-    if state_dir.exists():
-        import shutil
-
-        shutil.rmtree(state_dir)
-
     result = await jaffle_shop_server.toolImpl_build_models(ctx=None, modified_only=True)
 
     assert result["status"] == "error"
     assert "No previous run state found" in result["message"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_build_creates_state(seeded_jaffle_shop_server: "DbtCoreMcpServer"):
     """Test that successful build creates state for modified runs."""
     assert seeded_jaffle_shop_server.project_dir is not None
@@ -78,6 +69,7 @@ async def test_build_creates_state(seeded_jaffle_shop_server: "DbtCoreMcpServer"
     assert (state_dir / "manifest.json").exists()
 
 
+@pytest.mark.requires_dbt_exec
 async def test_build_fail_fast(seeded_jaffle_shop_server: "DbtCoreMcpServer"):
     """Test fail_fast flag is passed to dbt."""
     result = await seeded_jaffle_shop_server.toolImpl_build_models(ctx=None, fail_fast=True)
@@ -86,6 +78,7 @@ async def test_build_fail_fast(seeded_jaffle_shop_server: "DbtCoreMcpServer"):
     assert "--fail-fast" in result["command"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_build_exclude(seeded_jaffle_shop_server: "DbtCoreMcpServer"):
     """Test excluding specific models."""
     result = await seeded_jaffle_shop_server.toolImpl_build_models(ctx=None, exclude="customers")
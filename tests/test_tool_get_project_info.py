@@ -4,10 +4,13 @@ Tests for get_project_info tool.
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
 
+@pytest.mark.requires_dbt_exec
 async def test_get_project_info_with_debug(jaffle_shop_server: "DbtCoreMcpServer") -> None:
     """Test get_project_info with dbt debug enabled (default)."""
     result = await jaffle_shop_server.toolImpl_get_project_info(run_debug=True)
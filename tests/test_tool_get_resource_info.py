@@ -4,10 +4,13 @@ Tests for toolImpl_get_resource_info.
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
 
+@pytest.mark.requires_dbt_exec
 async def test_get_resource_info_with_compiled_sql(jaffle_shop_server: "DbtCoreMcpServer") -> None:
     """Test get_resource_info tool includes compiled SQL and triggers compilation if needed."""
     # Call the actual tool implementation (not just manifest method)
@@ -47,6 +50,7 @@ async def test_get_resource_info_compiled_sql_only_for_models(jaffle_shop_server
     assert "compiled_sql" not in seed_result
 
 
+@pytest.mark.requires_dbt_exec
 async def test_get_resource_info_uses_cached_compilation(jaffle_shop_server: "DbtCoreMcpServer") -> None:
     """Test that get_resource_info doesn't recompile when compiled SQL is already cached."""
     # First call - triggers compilation (manifest lacks compiled_code initially)
@@ -2,10 +2,16 @@
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
+# These tests run dbt commands that write to target/ and the DuckDB file; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("dbt_state")
+
 
+@pytest.mark.requires_dbt_exec
 async def test_install_deps_no_packages(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test install_deps when no packages.yml exists (or empty)."""
     # Jaffle shop doesn't have packages.yml, so this should succeed with 0 packages
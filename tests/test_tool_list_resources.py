@@ -4,6 +4,8 @@ Tests for toolImpl_list_resources.
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
@@ -21,52 +23,27 @@ async def test_list_resources_all(jaffle_shop_server: "DbtCoreMcpServer") -> Non
     assert "source" in resource_types
 
 
-async def test_list_resources_filter_models(jaffle_shop_server: "DbtCoreMcpServer") -> None:
-    """Test filtering by model resource type."""
-    result = await jaffle_shop_server.toolImpl_list_resources(resource_type="model")
-
-    assert isinstance(result, list)
-    assert len(result) > 0
-
-    # All results should be models
-    for resource in result:
-        assert resource["resource_type"] == "model"
-
-    # Should include known models
-    model_names = {r["name"] for r in result}
-    assert "customers" in model_names
-
-
-async def test_list_resources_filter_sources(jaffle_shop_server: "DbtCoreMcpServer") -> None:
-    """Test filtering by source resource type."""
-    result = await jaffle_shop_server.toolImpl_list_resources(resource_type="source")
-
-    assert isinstance(result, list)
-    assert len(result) > 0
-
-    # All results should be sources
-    for resource in result:
-        assert resource["resource_type"] == "source"
-
-    # Should include known sources
-    source_names = {r["name"] for r in result}
-    assert "customers" in source_names or "orders" in source_names
-
-
-async def test_list_resources_filter_seeds(jaffle_shop_server: "DbtCoreMcpServer") -> None:
-    """Test filtering by seed resource type."""
-    result = await jaffle_shop_server.toolImpl_list_resources(resource_type="seed")
+@pytest.mark.parametrize(
+    ("resource_type", "known_names"),
+    [
+        ("model", {"customers"}),
+        ("source", {"customers", "orders"}),
+        ("seed", {"raw_customers", "raw_orders"}),
+    ],
+)
+async def test_list_resources_filter_by_type(jaffle_shop_server: "DbtCoreMcpServer", resource_type: str, known_names: set[str]) -> None:
+    """Test filtering by resource type."""
+    result = await jaffle_shop_server.toolImpl_list_resources(resource_type=resource_type)
 
     assert isinstance(result, list)
     assert len(result) > 0
 
-    # All results should be seeds
-    for resource in result:
-        assert resource["resource_type"] == "seed"
+    # All results should be of the requested type
+    assert all(r["resource_type"] == resource_type for r in result)
 
-    # Should include known seeds
-    seed_names = {r["name"] for r in result}
-    assert "raw_customers" in seed_names or "raw_orders" in seed_names
+    # Should include at least one known resource of that type
+    names = {r["name"] for r in result}
+    assert names & known_names
 
 
 async def test_list_resources_consistent_structure(jaffle_shop_server: "DbtCoreMcpServer") -> None:
@@ -76,18 +53,23 @@ async def test_list_resources_consistent_structure(jaffle_shop_server: "DbtCoreM
     assert len(result) > 0
 
     # Check that each resource has required fields
-    for resource in result:
-        assert "name" in resource
-        assert "unique_id" in resource
-        assert "resource_type" in resource
-        assert "package_name" in resource
-        assert "description" in resource
-        assert "tags" in resource
+    required_fields = {"name", "unique_id", "resource_type", "package_name", "description", "tags"}
+    missing = [(r.get("unique_id"), required_fields - r.keys()) for r in result if not required_fields <= r.keys()]
+    assert not missing
+
+
+async def test_list_resources_paging(jaffle_shop_server: "DbtCoreMcpServer") -> None:
+    """Test that offset/limit pages through the same resources as an unpaged call."""
+    all_models = await jaffle_shop_server.toolImpl_list_resources(resource_type="model")
+
+    first_page = await jaffle_shop_server.toolImpl_list_resources(resource_type="model", limit=2)
+    rest = await jaffle_shop_server.toolImpl_list_resources(resource_type="model", offset=2)
+
+    assert len(first_page) == 2
+    assert first_page + rest == all_models
 
 
 async def test_list_resources_invalid_type(jaffle_shop_server: "DbtCoreMcpServer") -> None:
     """Test that invalid resource type raises ValueError."""
-    import pytest
-
     with pytest.raises(ValueError, match="Invalid resource_type"):
         await jaffle_shop_server.toolImpl_list_resources(resource_type="invalid_type")
@@ -4,9 +4,14 @@ Tests for query_database tool.
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
+# Every query goes through dbt show
+pytestmark = pytest.mark.requires_dbt_exec
+
 
 async def test_query_database_simple_select(jaffle_shop_server: "DbtCoreMcpServer") -> None:
     """Test query_database with a simple SELECT query."""
@@ -1,5 +1,6 @@
 """Tests for seed_data tool."""
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
@@ -7,7 +8,11 @@ import pytest
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
+# These tests run dbt commands that write to target/ and the DuckDB file; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("dbt_state")
 
+
+@pytest.mark.requires_dbt_exec
 async def test_seed_all(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test loading all seed files."""
     result = await jaffle_shop_server.toolImpl_seed_data()
@@ -26,6 +31,7 @@ async def test_seed_all(jaffle_shop_server: "DbtCoreMcpServer"):
         assert seed_result["status"] in ["success", "pass"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_seed_select_specific(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test loading a specific seed file."""
     result = await jaffle_shop_server.toolImpl_seed_data(select="raw_customers")
@@ -45,22 +51,15 @@ async def test_seed_invalid_combination(jaffle_shop_server: "DbtCoreMcpServer"):
         await jaffle_shop_server.toolImpl_seed_data(select="raw_customers", modified_only=True)
 
 
-async def test_seed_modified_only_requires_state(jaffle_shop_server: "DbtCoreMcpServer"):
+async def test_seed_modified_only_requires_state(jaffle_shop_server: "DbtCoreMcpServer", clean_state_dir: Path):
     """Test that modified_only requires previous state."""
-    # Remove state if it exists
-    assert jaffle_shop_server.project_dir is not None
-    state_dir = jaffle_shop_server.project_dir / "target" / "state_last_run"
-    if state_dir.exists():
-        import shutil
-
-        shutil.rmtree(state_dir)
-
     result = await jaffle_shop_server.toolImpl_seed_data(modified_only=True)
 
     assert result["status"] == "error"
     assert "No previous seed state found" in result["message"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_seed_creates_state(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test that successful seed creates state for modified runs."""
     assert jaffle_shop_server.project_dir is not None
@@ -74,6 +73,7 @@ async def test_seed_creates_state(jaffle_shop_server: "DbtCoreMcpServer"):
     assert (state_dir / "manifest.json").exists()
 
 
+@pytest.mark.requires_dbt_exec
 async def test_seed_full_refresh(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test full_refresh flag is passed to dbt."""
     result = await jaffle_shop_server.toolImpl_seed_data(full_refresh=True)
@@ -82,6 +82,7 @@ async def test_seed_full_refresh(jaffle_shop_server: "DbtCoreMcpServer"):
     assert "--full-refresh" in result["command"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_seed_show(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test show flag is passed to dbt."""
     result = await jaffle_shop_server.toolImpl_seed_data(show=True)
@@ -90,6 +91,7 @@ async def test_seed_show(jaffle_shop_server: "DbtCoreMcpServer"):
     assert "--show" in result["command"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_seed_exclude(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test excluding specific seeds."""
     result = await jaffle_shop_server.toolImpl_seed_data(exclude="raw_customers")
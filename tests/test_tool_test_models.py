@@ -1,5 +1,6 @@
 """Tests for test_models tool."""
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
@@ -7,7 +8,11 @@ import pytest
 if TYPE_CHECKING:
     from dbt_core_mcp.server import DbtCoreMcpServer
 
+# These tests run dbt commands that write to target/ and the DuckDB file; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("dbt_state")
 
+
+@pytest.mark.requires_dbt_exec
 async def test_test_all_models(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test running all tests."""
     result = await jaffle_shop_server.toolImpl_test_models()
@@ -26,6 +31,7 @@ async def test_test_all_models(jaffle_shop_server: "DbtCoreMcpServer"):
         assert test_result["status"] in ["pass", "success"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_test_specific_model(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test running tests for a specific model."""
     result = await jaffle_shop_server.toolImpl_test_models(select="customers")
@@ -45,22 +51,15 @@ async def test_test_invalid_combination(jaffle_shop_server: "DbtCoreMcpServer"):
         await jaffle_shop_server.toolImpl_test_models(select="customers", modified_only=True)
 
 
-async def test_test_modified_only_requires_state(jaffle_shop_server: "DbtCoreMcpServer"):
+async def test_test_modified_only_requires_state(jaffle_shop_server: "DbtCoreMcpServer", clean_state_dir: Path):
     """Test that modified_only requires previous state."""
-    # Remove state if it exists
-    assert jaffle_shop_server.project_dir is not None
-    state_dir = jaffle_shop_server.project_dir / "target" / "state_last_run"
-    if state_dir.exists():
-        import shutil
-
-        shutil.rmtree(state_dir)
-
     result = await jaffle_shop_server.toolImpl_test_models(modified_only=True)
 
     assert result["status"] == "error"
     assert "No previous run state found" in result["message"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_test_creates_uses_state(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test that running tests uses state from previous run."""
     # First run models to create state
@@ -80,6 +79,7 @@ async def test_test_creates_uses_state(jaffle_shop_server: "DbtCoreMcpServer"):
     assert "--state target/state_last_run" in result["command"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_test_fail_fast(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test fail_fast flag is passed to dbt."""
     result = await jaffle_shop_server.toolImpl_test_models(fail_fast=True)
@@ -88,6 +88,7 @@ async def test_test_fail_fast(jaffle_shop_server: "DbtCoreMcpServer"):
     assert "--fail-fast" in result["command"]
 
 
+@pytest.mark.requires_dbt_exec
 async def test_test_exclude(jaffle_shop_server: "DbtCoreMcpServer"):
     """Test excluding specific tests."""
     result = await jaffle_shop_server.toolImpl_test_models(exclude="not_null*")